@@ -0,0 +1,709 @@
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+
+from resume_parser import ResumeParser, pipeline_metrics
+from job_matcher import JobMatcher
+from exporters import open_exporter
+from taxonomy import SkillTaxonomy
+from sharding import ShardedMatcher
+
+PIPELINE_STAGES = ['read', 'contact', 'keywords', 'match', 'export']
+SUITES = ['pipeline', 'extraction', 'matching', 'matrix', 'taxonomy', 'sharded', 'text', 'startup']
+DESCRIPTION_WORDS = ['build', 'scalable', 'backend', 'services', 'data', 'pipelines', 'dashboards', 'customers',
+                     'platform', 'mobile', 'payments', 'analytics', 'models', 'security', 'cloud', 'infrastructure',
+                     'frontend', 'reporting', 'healthcare', 'fintech', 'retail', 'logistics', 'research', 'testing',
+                     'automation', 'integrations', 'apis', 'microservices', 'monitoring', 'experiments']
+TAXONOMY_SYLLABLES = ['ka', 'lo', 'mi', 'nu', 'ra', 'ze', 'to', 'vi', 'qu', 'sa', 'do', 'fe', 'gi', 'ha', 'jo', 'pe']
+
+IMPORT_TARGETS = {
+    'resume_parser': 'import resume_parser',
+    'job_matcher': 'import job_matcher',
+    'matcher_ready': 'import job_matcher; job_matcher.JobMatcher()',
+    'main': 'import main',
+    'gui': 'import gui',
+    'legacy_main_imports': 'import tkinter, tkinter.ttk, tkinter.filedialog, tkinter.messagebox, '
+                           'tkinter.scrolledtext, pandas, numpy'
+}
+
+STARTUP_PROBE = '''
+import json, sys, time
+def rss_kb():
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except OSError:
+        return None
+rss_before = rss_kb()
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+rss_after = rss_kb()
+print(json.dumps({{'seconds': elapsed, 'modules': len(sys.modules),
+                  'rss_growth_kb': None if rss_before is None else rss_after - rss_before}}))
+'''
+
+WORKER_PROBE = '''
+import json, multiprocessing, sys, time
+from concurrent.futures import ProcessPoolExecutor
+start = time.perf_counter()
+from resume_parser import ResumeParser, init_batch_worker, parse_resume_chunk
+with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn'),
+                         initializer=init_batch_worker, initargs=(ResumeParser(),)) as executor:
+    executor.submit(parse_resume_chunk, [sys.argv[1]]).result()
+print(json.dumps({'seconds': time.perf_counter() - start}))
+'''
+
+def legacy_analyze(parser, text):
+    text_lower = text.lower()
+    
+    skills = {}
+    for category, pattern in parser.skills_patterns.items():
+        skills[category] = list(set(re.findall(pattern, text_lower, re.IGNORECASE)))
+    
+    education = {}
+    for category, pattern in parser.education_patterns.items():
+        education[category] = list(set(re.findall(pattern, text_lower, re.IGNORECASE)))
+    
+    experience = {}
+    years_match = re.search(parser.experience_patterns['years'], text_lower, re.IGNORECASE)
+    experience['years'] = int(years_match.group(1)) if years_match else 0
+    positions = re.findall(parser.experience_patterns['positions'], text_lower, re.IGNORECASE)
+    experience['positions'] = list(set(positions))
+    
+    return {
+        'skills': skills,
+        'education': education,
+        'experience': experience
+    }
+
+def legacy_match_jobs(matcher, parsed_resume):
+    matches = []
+    for job in matcher.job_database:
+        required_skill_match = matcher.calculate_skill_match(parsed_resume['skills'], job['required_skills'])
+        preferred_skill_match = matcher.calculate_skill_match(parsed_resume['skills'], job['preferred_skills'])
+        experience_match = matcher.calculate_experience_match(parsed_resume['experience'], job['experience_required'])
+        education_match = matcher.calculate_education_match(parsed_resume['education'], job['education_required'])
+        
+        overall_score = (
+            required_skill_match * 0.4 +
+            preferred_skill_match * 0.2 +
+            experience_match * 0.3 +
+            education_match * 0.1
+        )
+        
+        matches.append({
+            'job': job,
+            'scores': {
+                'required_skills': round(required_skill_match, 2),
+                'preferred_skills': round(preferred_skill_match, 2),
+                'experience': round(experience_match, 2),
+                'education': round(education_match, 2),
+                'overall': round(overall_score, 2)
+            }
+        })
+    
+    return sorted(matches, key=lambda x: x['scores']['overall'], reverse=True)
+
+def normalize(analysis):
+    normalized = {}
+    for section, values in analysis.items():
+        normalized[section] = {key: sorted(value) if isinstance(value, list) else value
+                               for key, value in values.items()}
+    return normalized
+
+def section_terms(parser, section):
+    scanner = parser.get_keyword_scanner()
+    return sorted(term for term, ranks in scanner.terms.items()
+                  if any(term_section == section for term_section, _ in ranks))
+
+def make_resume(parser, size, seed=0, skill_density=0.15):
+    rng = random.Random(seed)
+    skills = section_terms(parser, 'skills')
+    other_terms = section_terms(parser, 'education') + section_terms(parser, 'experience')
+    filler = ['worked', 'on', 'the', 'team', 'delivered', 'projects', 'using', 'and', 'with',
+              'in', 'a', 'fast', 'paced', 'environment', 'Built', 'services', 'for', 'clients']
+    
+    words = ['John Doe', 'john.doe@example.com', '(555) 123-4567', '5+ years of experience']
+    length = sum(len(word) + 1 for word in words)
+    while length < size:
+        roll = rng.random()
+        if roll < skill_density:
+            word = rng.choice(skills)
+        elif roll < skill_density + 0.03:
+            word = rng.choice(other_terms)
+        else:
+            word = rng.choice(filler)
+        words.append(word.title() if rng.random() < 0.1 else word)
+        length += len(word) + 1
+    
+    return ' '.join(words)
+
+def write_resume_corpus(directory, count, size, skill_density=0.15, seed=0):
+    parser = ResumeParser()
+    os.makedirs(directory, exist_ok=True)
+    
+    file_paths = []
+    for i in range(count):
+        file_path = os.path.join(directory, f"resume_{i:05d}.txt")
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(make_resume(parser, size, seed=seed + i, skill_density=skill_density))
+        file_paths.append(file_path)
+    
+    return file_paths
+
+def make_job_catalog(count, seed=0):
+    rng = random.Random(seed)
+    text_rng = random.Random(seed + 1)
+    skills = section_terms(ResumeParser(), 'skills')
+    skills += ['typescript', 'mlflow', 'graphql', 'rust', 'erlang', 'haskell', 'fortran', 'cobol']
+    degrees = ['bachelor', 'master', 'phd']
+    fields = ['computer science', 'data science', 'artificial intelligence', 'business', 'finance']
+    titles = ['Developer', 'Engineer', 'Analyst', 'Scientist', 'Architect', 'Consultant']
+    
+    jobs = []
+    for job_id in range(1, count + 1):
+        jobs.append({
+            'id': job_id,
+            'title': f"{rng.choice(['Junior', 'Senior', 'Lead', ''])} {rng.choice(titles)}".strip(),
+            'company': f"Company {rng.randint(1, 5000)}",
+            'location': rng.choice(['Remote', 'San Francisco, CA', 'New York, NY', 'Austin, TX', 'Seattle, WA']),
+            'required_skills': rng.sample(skills, rng.randint(0, 6)),
+            'preferred_skills': rng.sample(skills, rng.randint(0, 4)),
+            'experience_required': rng.randint(0, 10),
+            'education_required': [rng.choice(degrees), rng.choice(fields)],
+            'description': ' '.join(text_rng.choice(DESCRIPTION_WORDS) for _ in range(text_rng.randint(8, 40)))
+        })
+    
+    return jobs
+
+def make_taxonomy_entries(count, seed=0):
+    rng = random.Random(seed)
+    categories = ['languages', 'data', 'platforms', 'libraries', 'practices']
+    
+    entries = []
+    names = set()
+    while len(entries) < count:
+        tokens = [''.join(rng.choice(TAXONOMY_SYLLABLES) for _ in range(rng.randint(2, 4)))
+                  for _ in range(rng.choice([1, 1, 1, 2, 2, 3]))]
+        name = ' '.join(tokens)
+        if name in names:
+            continue
+        names.add(name)
+        aliases = [''.join(tokens)] if len(tokens) > 1 else [f"{name}.js", f"{name}-lang"][:rng.randint(0, 2)]
+        entries.append({'name': name, 'category': rng.choice(categories), 'aliases': aliases})
+    
+    return entries
+
+def make_taxonomy_resume(entries, size, seed=0, skill_density=0.15):
+    rng = random.Random(seed)
+    filler = ['worked', 'on', 'the', 'team', 'delivered', 'projects', 'using', 'and', 'with', 'in']
+    
+    words = []
+    length = 0
+    while length < size:
+        if rng.random() < skill_density:
+            entry = rng.choice(entries)
+            word = rng.choice([entry['name']] + entry['aliases'])
+        else:
+            word = rng.choice(filler)
+        words.append(word.title() if rng.random() < 0.1 else word)
+        length += len(word) + 1
+    
+    return ' '.join(words)
+
+def run_taxonomy_benchmark(sizes, resume_size, repeats, alternation_limit=10_000):
+    print(f"{'Entries':>10} {'Load (ms)':>10} {'Scan (ms)':>10} {'Parse (ms)':>11} {'Alternation (ms)':>17}")
+    
+    entries = make_taxonomy_entries(max(sizes))
+    text = make_taxonomy_resume(entries[:min(sizes)], resume_size)
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            file_path = os.path.join(directory, f"taxonomy_{size}.jsonl")
+            with open_exporter(file_path) as exporter:
+                for entry in entries[:size]:
+                    exporter.write_record(entry)
+            
+            start = time.perf_counter()
+            taxonomy = SkillTaxonomy.load(file_path)
+            load_time = time.perf_counter() - start
+            
+            parser = ResumeParser()
+            parser.add_skill_taxonomy(taxonomy)
+            text_lower = text.lower()
+            scan_time = time_call(lambda: taxonomy.scan(text_lower), repeats)
+            parse_time = time_call(lambda: parser.analyze_text(text), repeats)
+            row = {'entries': size, 'load_seconds': load_time, 'scan_seconds': scan_time,
+                   'parse_seconds': parse_time, 'alternation_seconds': None}
+            
+            if size <= alternation_limit:
+                terms = sorted(set(term for entry in entries[:size] for term in [entry['name']] + entry['aliases']),
+                               key=len, reverse=True)
+                regex = re.compile(r'\b(?:' + '|'.join(re.escape(term) for term in terms) + r')\b')
+                row['alternation_seconds'] = time_call(lambda: regex.findall(text_lower), 1)
+            rows.append(row)
+            
+            alternation = row['alternation_seconds']
+            alternation = f"{alternation * 1000:>17.2f}" if alternation is not None else f"{'-':>17}"
+            print(f"{size:>10} {load_time * 1000:>10.1f} {scan_time * 1000:>10.2f} "
+                  f"{parse_time * 1000:>11.2f} {alternation}")
+    
+    return rows
+
+def time_call(func, repeats):
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def run_extraction_benchmark(sizes, repeats):
+    parser = ResumeParser()
+    print(f"{'Size':>12} {'Legacy (ms)':>12} {'Scanner (ms)':>13} {'Speedup':>8}")
+    
+    rows = []
+    for size in sizes:
+        text = make_resume(parser, size, seed=size)
+        
+        if normalize(legacy_analyze(parser, text)) != normalize(parser.analyze_text(text)):
+            raise AssertionError(f"Scanner output differs from legacy extraction at size {size}")
+        
+        legacy_time = time_call(lambda: legacy_analyze(parser, text), repeats)
+        scanner_time = time_call(lambda: parser.analyze_text(text), repeats)
+        rows.append({'size': size, 'legacy_seconds': legacy_time, 'scanner_seconds': scanner_time})
+        
+        print(f"{size:>12} {legacy_time * 1000:>12.2f} {scanner_time * 1000:>13.2f} "
+              f"{legacy_time / scanner_time:>7.2f}x")
+    
+    return rows
+
+def run_matching_benchmark(job_counts, repeats, top_k):
+    parser = ResumeParser()
+    parsed_resume = parser.analyze_text(make_resume(parser, 600, seed=7))
+    print(f"{'Jobs':>12} {'Legacy (ms)':>12} {'Vectorized (ms)':>16} {'Top-k (ms)':>11} {'Memo hit (ms)':>14} "
+          f"{'Speedup':>8}")
+    
+    rows = []
+    for count in job_counts:
+        matcher = JobMatcher(memo=False)
+        matcher.load_jobs(make_job_catalog(count, seed=count))
+        memo_matcher = JobMatcher()
+        memo_matcher.load_jobs(matcher.job_database)
+        
+        expected = legacy_match_jobs(matcher, parsed_resume)
+        if expected != matcher.match_jobs(parsed_resume):
+            raise AssertionError(f"Vectorized matcher output differs from legacy matcher at {count} jobs")
+        if expected[:top_k] != matcher.match_jobs(parsed_resume, top_k=top_k):
+            raise AssertionError(f"Top-k matcher output differs from legacy matcher at {count} jobs")
+        
+        legacy_time = time_call(lambda: legacy_match_jobs(matcher, parsed_resume), 1)
+        vectorized_time = time_call(lambda: matcher.match_jobs(parsed_resume), repeats)
+        top_k_time = time_call(lambda: matcher.match_jobs(parsed_resume, top_k=top_k), repeats)
+        memo_matcher.match_jobs(parsed_resume, top_k=top_k)
+        memo_time = time_call(lambda: memo_matcher.match_jobs(parsed_resume, top_k=top_k), repeats)
+        rows.append({
+            'jobs': count,
+            'legacy_seconds': legacy_time,
+            'vectorized_seconds': vectorized_time,
+            'top_k_seconds': top_k_time,
+            'memo_hit_seconds': memo_time
+        })
+        
+        print(f"{count:>12} {legacy_time * 1000:>12.2f} {vectorized_time * 1000:>16.2f} "
+              f"{top_k_time * 1000:>11.2f} {memo_time * 1000:>14.3f} {legacy_time / top_k_time:>7.2f}x")
+    
+    return rows
+
+def run_matrix_benchmark(resume_count, job_count, top_k):
+    parser = ResumeParser()
+    parsed_resumes = [parser.analyze_text(make_resume(parser, 600, seed=seed)) for seed in range(resume_count)]
+    matcher = JobMatcher(memo=False)
+    matcher.load_jobs(make_job_catalog(job_count, seed=job_count))
+    
+    looped_time = time_call(lambda: [matcher.match_jobs(resume, top_k=top_k) for resume in parsed_resumes], 1)
+    by_resume_time = time_call(lambda: matcher.match_matrix(parsed_resumes, top_k=top_k), 1)
+    by_job_time = time_call(lambda: matcher.match_matrix(parsed_resumes, top_k=top_k, by='job'), 1)
+    
+    print(f"{resume_count} resumes x {job_count} jobs: match_jobs loop {looped_time:.2f}s, "
+          f"match_matrix by resume {by_resume_time:.2f}s, by job {by_job_time:.2f}s")
+    
+    return {
+        'resumes': resume_count,
+        'jobs': job_count,
+        'loop_seconds': looped_time,
+        'by_resume_seconds': by_resume_time,
+        'by_job_seconds': by_job_time
+    }
+
+def run_sharded_benchmark(resume_count, job_count, shard_counts, top_k):
+    parser = ResumeParser()
+    parsed_resumes = [parser.analyze_text(make_resume(parser, 600, seed=seed)) for seed in range(resume_count)]
+    jobs = make_job_catalog(job_count, seed=job_count)
+    matcher = JobMatcher(memo=False)
+    matcher.load_jobs(jobs)
+    
+    rng = random.Random(job_count)
+    text_resumes = [dict(parsed_resume, text_terms=sorted(rng.sample(DESCRIPTION_WORDS, 12)))
+                    for parsed_resume in parsed_resumes]
+    text_matcher = JobMatcher(memo=False, text_weight=0.5)
+    text_matcher.load_jobs(jobs)
+    text_expected = text_matcher.match_matrix(text_resumes, top_k=top_k)
+    
+    expected = matcher.match_matrix(parsed_resumes, top_k=top_k)
+    single_time = time_call(lambda: matcher.match_matrix(parsed_resumes, top_k=top_k), 1)
+    print(f"{resume_count} resumes x {job_count} jobs, single process: {single_time:.2f}s")
+    print(f"{'Shards':>8} {'Startup (s)':>12} {'Match (s)':>10} {'Slowest shard (s)':>18} {'Speedup':>8}")
+    
+    rows = []
+    for shards in shard_counts:
+        started = time.perf_counter()
+        with ShardedMatcher(jobs=jobs, shards=shards) as sharded:
+            startup_time = time.perf_counter() - started
+            if sharded.match_matrix(parsed_resumes, top_k=top_k) != expected:
+                raise AssertionError(f"Sharded matcher output differs from single process at {shards} shards")
+            match_time = time_call(lambda: sharded.match_matrix(parsed_resumes, top_k=top_k), 1)
+            shard_times = [stats['last_seconds'] for stats in sharded.shard_stats()]
+        
+        with ShardedMatcher(jobs=jobs, shards=shards, text_weight=0.5) as sharded:
+            if sharded.match_matrix(text_resumes, top_k=top_k) != text_expected:
+                raise AssertionError(f"Sharded text matching differs from single process at {shards} shards")
+        
+        rows.append({
+            'shards': shards,
+            'startup_seconds': startup_time,
+            'match_seconds': match_time,
+            'shard_seconds': shard_times
+        })
+        print(f"{shards:>8} {startup_time:>12.2f} {match_time:>10.2f} {max(shard_times):>18.2f} "
+              f"{single_time / match_time:>7.2f}x")
+    
+    return {'resumes': resume_count, 'jobs': job_count, 'single_seconds': single_time, 'shards': rows}
+
+def run_text_benchmark(job_count, resume_count, top_k, repeats, text_weight=0.2):
+    parser = ResumeParser(keep_text_terms=True)
+    rng = random.Random(job_count)
+    parsed_resumes = [
+        parser.parse_text(make_resume(parser, 1500, seed=seed) + ' ' +
+                          ' '.join(rng.choice(DESCRIPTION_WORDS) for _ in range(60)))
+        for seed in range(resume_count)
+    ]
+    jobs = make_job_catalog(job_count, seed=job_count)
+    
+    started = time.perf_counter()
+    matcher = JobMatcher(memo=False)
+    matcher.load_jobs(jobs)
+    build_time = time.perf_counter() - started
+    started = time.perf_counter()
+    text_matcher = JobMatcher(memo=False, text_weight=text_weight)
+    text_matcher.load_jobs(jobs)
+    text_build_time = time.perf_counter() - started
+    
+    if text_matcher.match_matrix(parsed_resumes, top_k=top_k) != [
+            text_matcher.match_jobs(parsed_resume, top_k=top_k) for parsed_resume in parsed_resumes]:
+        raise AssertionError("match_matrix with text relevance differs from match_jobs")
+    
+    queries = [' '.join(parsed_resume['text_terms']) for parsed_resume in parsed_resumes]
+    search_time = time_call(lambda: [text_matcher.search_jobs(query, top_k=top_k) for query in queries],
+                            repeats) / resume_count
+    match_time = time_call(lambda: [matcher.match_jobs(resume, top_k=top_k) for resume in parsed_resumes],
+                           repeats) / resume_count
+    text_match_time = time_call(lambda: [text_matcher.match_jobs(resume, top_k=top_k) for resume in parsed_resumes],
+                                repeats) / resume_count
+    
+    extra_jobs = make_job_catalog(100, seed=job_count + 1)
+    for job in extra_jobs:
+        job['id'] += job_count
+    started = time.perf_counter()
+    text_matcher.add_jobs(extra_jobs)
+    text_matcher.search_jobs(queries[0], top_k=top_k)
+    update_time = time.perf_counter() - started
+    
+    print(f"{job_count} jobs: build {build_time:.2f}s, with text index {text_build_time:.2f}s")
+    print(f"search_jobs {search_time * 1000:.2f} ms, match_jobs {match_time * 1000:.2f} ms, "
+          f"with text weight {text_weight} {text_match_time * 1000:.2f} ms per resume")
+    print(f"add 100 jobs and search again: {update_time * 1000:.2f} ms")
+    
+    return {
+        'jobs': job_count,
+        'build_seconds': build_time,
+        'text_build_seconds': text_build_time,
+        'search_seconds': search_time,
+        'match_seconds': match_time,
+        'text_match_seconds': text_match_time,
+        'update_seconds': update_time
+    }
+
+def export_results(parsed_resume, job_matches, directory):
+    for file_name in ('matches.jsonl', 'matches.csv'):
+        with open_exporter(os.path.join(directory, file_name), include_resume=True) as exporter:
+            exporter.write_matches(job_matches, parsed_resume['file_name'])
+
+def run_pipeline(parser, matcher, file_paths, top_k, directory, memory=False):
+    totals = {stage: 0.0 for stage in PIPELINE_STAGES}
+    peaks = {stage: 0 for stage in PIPELINE_STAGES}
+    
+    def measure(stage, func, *args):
+        if memory:
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        result = func(*args)
+        totals[stage] += time.perf_counter() - start
+        if memory:
+            peaks[stage] = max(peaks[stage], tracemalloc.get_traced_memory()[1] - baseline)
+        return result
+    
+    for file_path in file_paths:
+        text = measure('read', parser.extract_text_from_file, file_path)
+        contact_info = measure('contact', parser.extract_contact_info, text)
+        analysis = measure('keywords', parser.analyze_text, text)
+        
+        parsed_resume = {
+            'file_name': os.path.basename(file_path),
+            'contact_info': contact_info,
+            'skills': analysis['skills'],
+            'education': analysis['education'],
+            'experience': analysis['experience'],
+            'text_length': len(text),
+            'parsed_at': datetime.now().isoformat()
+        }
+        job_matches = measure('match', matcher.match_jobs, parsed_resume, top_k)
+        measure('export', export_results, parsed_resume, job_matches, directory)
+    
+    return totals, peaks
+
+def run_pipeline_benchmark(resume_count, resume_size, skill_density, job_count, top_k, repeats):
+    parser = ResumeParser()
+    matcher = JobMatcher(memo=False)
+    start = time.perf_counter()
+    matcher.load_jobs(make_job_catalog(job_count, seed=job_count))
+    catalog_time = time.perf_counter() - start
+    
+    with tempfile.TemporaryDirectory() as directory:
+        file_paths = write_resume_corpus(os.path.join(directory, 'resumes'), resume_count,
+                                         resume_size, skill_density)
+        total_bytes = sum(os.path.getsize(file_path) for file_path in file_paths)
+        
+        best = None
+        for _ in range(repeats):
+            totals, _ = run_pipeline(parser, matcher, file_paths, top_k, directory)
+            best = totals if best is None else {stage: min(best[stage], totals[stage]) for stage in best}
+        
+        tracemalloc.start()
+        try:
+            _, peaks = run_pipeline(parser, matcher, file_paths, top_k, directory, memory=True)
+        finally:
+            tracemalloc.stop()
+    
+    print(f"{resume_count} resumes of {resume_size} chars (skill density {skill_density}) "
+          f"against {job_count} jobs, catalog load {catalog_time * 1000:.2f} ms")
+    print(f"{'Stage':>12} {'Total (ms)':>12} {'Per resume (ms)':>16} {'Resumes/s':>11} {'Peak (KiB)':>11}")
+    
+    stages = {}
+    for stage in PIPELINE_STAGES:
+        seconds = best[stage]
+        stages[stage] = {
+            'seconds': seconds,
+            'per_resume_ms': seconds / resume_count * 1000,
+            'resumes_per_second': resume_count / seconds if seconds else None,
+            'peak_bytes': peaks[stage]
+        }
+        print(f"{stage:>12} {seconds * 1000:>12.2f} {seconds / resume_count * 1000:>16.3f} "
+              f"{resume_count / seconds if seconds else float('inf'):>11.1f} {peaks[stage] / 1024:>11.1f}")
+    
+    total_time = sum(best.values())
+    print(f"{'total':>12} {total_time * 1000:>12.2f} {total_time / resume_count * 1000:>16.3f} "
+          f"{resume_count / total_time:>11.1f} {max(peaks.values()) / 1024:>11.1f}")
+    
+    return {
+        'resumes': resume_count,
+        'resume_size': resume_size,
+        'skill_density': skill_density,
+        'jobs': job_count,
+        'top_k': top_k,
+        'catalog_load_seconds': catalog_time,
+        'stages': stages,
+        'total_seconds': total_time,
+        'resumes_per_second': resume_count / total_time,
+        'megabytes_per_second': total_bytes / total_time / (1024 * 1024),
+        'peak_bytes': max(peaks.values())
+    }
+
+def run_probe(code, *args):
+    output = subprocess.run([sys.executable, '-c', code, *args], cwd=os.path.dirname(os.path.abspath(__file__)),
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def run_startup_benchmark(repeats):
+    print(f"{'Import':<22} {'Time (ms)':>10} {'Modules':>8} {'RSS growth (MiB)':>17}")
+    
+    rows = {}
+    for name, statement in IMPORT_TARGETS.items():
+        try:
+            runs = [run_probe(STARTUP_PROBE.format(statement=statement)) for _ in range(repeats)]
+        except subprocess.CalledProcessError:
+            print(f"{name:<22} {'unavailable':>10}")
+            continue
+        
+        best = min(runs, key=lambda run: run['seconds'])
+        rows[name] = best
+        growth = 'n/a' if best['rss_growth_kb'] is None else f"{best['rss_growth_kb'] / 1024:.1f}"
+        print(f"{name:<22} {best['seconds'] * 1000:>10.1f} {best['modules']:>8} {growth:>17}")
+    
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = write_resume_corpus(directory, 1, 4_000)[0]
+        worker_time = min(run_probe(WORKER_PROBE, file_path)['seconds'] for _ in range(repeats))
+    print(f"Spawned parse worker cold start to first result: {worker_time * 1000:.1f} ms")
+    
+    return {'imports': rows, 'worker_cold_start_seconds': worker_time}
+
+def timing_metrics(results):
+    metrics = {}
+    pipeline = results.get('pipeline')
+    if pipeline:
+        for stage, values in pipeline['stages'].items():
+            metrics[f"pipeline.{stage}"] = values['seconds']
+        metrics['pipeline.total'] = pipeline['total_seconds']
+    for row in results.get('extraction', []):
+        metrics[f"extraction.{row['size']}.scanner"] = row['scanner_seconds']
+    for row in results.get('matching', []):
+        metrics[f"matching.{row['jobs']}.vectorized"] = row['vectorized_seconds']
+        metrics[f"matching.{row['jobs']}.top_k"] = row['top_k_seconds']
+    startup = results.get('startup')
+    if startup:
+        for name, values in startup['imports'].items():
+            metrics[f"startup.{name}"] = values['seconds']
+        metrics['startup.worker_cold_start'] = startup['worker_cold_start_seconds']
+    for row in results.get('taxonomy', []):
+        metrics[f"taxonomy.{row['entries']}.scan"] = row['scan_seconds']
+    matrix = results.get('matrix')
+    if matrix:
+        metrics['matrix.by_resume'] = matrix['by_resume_seconds']
+        metrics['matrix.by_job'] = matrix['by_job_seconds']
+    text = results.get('text')
+    if text:
+        metrics['text.search'] = text['search_seconds']
+        metrics['text.match'] = text['text_match_seconds']
+    sharded = results.get('sharded')
+    if sharded:
+        for row in sharded['shards']:
+            metrics[f"sharded.{row['shards']}.match"] = row['match_seconds']
+    return metrics
+
+def compare_results(baseline, current, tolerance):
+    baseline_metrics = timing_metrics(baseline)
+    current_metrics = timing_metrics(current)
+    
+    regressions = []
+    print(f"{'Metric':<32} {'Baseline (ms)':>14} {'Current (ms)':>13} {'Change':>8}")
+    for name, seconds in current_metrics.items():
+        previous = baseline_metrics.get(name)
+        if not previous:
+            continue
+        
+        change = seconds / previous - 1
+        flag = ' REGRESSION' if change > tolerance else ''
+        print(f"{name:<32} {previous * 1000:>14.2f} {seconds * 1000:>13.2f} {change:>+7.1%}{flag}")
+        if flag:
+            regressions.append(name)
+    
+    return regressions
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Resume Parser benchmarks")
+    arg_parser.add_argument('--suites', nargs='+', choices=SUITES, default=SUITES)
+    arg_parser.add_argument('--sizes', type=int, nargs='+',
+                            default=[10_000, 100_000, 1_000_000, 5_000_000])
+    arg_parser.add_argument('--jobs', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    arg_parser.add_argument('--top-k', type=int, default=10)
+    arg_parser.add_argument('--matrix', type=int, nargs=2, default=[1_000, 20_000],
+                            metavar=('RESUMES', 'JOBS'))
+    arg_parser.add_argument('--text-jobs', type=int, default=100_000)
+    arg_parser.add_argument('--shards', type=int, nargs='+', default=[1, 2, 4])
+    arg_parser.add_argument('--taxonomy-sizes', type=int, nargs='+',
+                            default=[1_000, 10_000, 50_000, 100_000])
+    arg_parser.add_argument('--resumes', type=int, default=200)
+    arg_parser.add_argument('--resume-size', type=int, default=4_000)
+    arg_parser.add_argument('--skill-density', type=float, default=0.15)
+    arg_parser.add_argument('--catalog-size', type=int, default=10_000)
+    arg_parser.add_argument('--repeats', type=int, default=3)
+    arg_parser.add_argument('--output', help="Write results as JSON to this file")
+    arg_parser.add_argument('--compare', help="Compare timings against a previous JSON results file")
+    arg_parser.add_argument('--tolerance', type=float, default=0.2,
+                            help="Allowed slowdown before a metric counts as a regression")
+    arg_parser.add_argument('--no-metrics', action='store_true',
+                            help="Turn off the in-process stage timers while benchmarking")
+    arg_parser.add_argument('--profile', action='store_true',
+                            help="Print a cProfile report of the timed stages")
+    args = arg_parser.parse_args()
+    
+    pipeline_metrics.enabled = not args.no_metrics
+    if args.profile:
+        pipeline_metrics.start_profiling(cpu=True)
+    
+    results = {
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'numpy': np.__version__,
+        'config': {key: value for key, value in vars(args).items()
+                   if key not in ('output', 'compare', 'profile')}
+    }
+    
+    for suite in args.suites:
+        if suite == 'pipeline':
+            results['pipeline'] = run_pipeline_benchmark(args.resumes, args.resume_size, args.skill_density,
+                                                         args.catalog_size, args.top_k, args.repeats)
+        elif suite == 'extraction':
+            results['extraction'] = run_extraction_benchmark(args.sizes, args.repeats)
+        elif suite == 'matching':
+            results['matching'] = run_matching_benchmark(args.jobs, args.repeats, args.top_k)
+        elif suite == 'matrix':
+            results['matrix'] = run_matrix_benchmark(args.matrix[0], args.matrix[1], args.top_k)
+        elif suite == 'taxonomy':
+            results['taxonomy'] = run_taxonomy_benchmark(args.taxonomy_sizes, args.resume_size, args.repeats)
+        elif suite == 'text':
+            results['text'] = run_text_benchmark(args.text_jobs, 20, args.top_k, args.repeats)
+        elif suite == 'sharded':
+            results['sharded'] = run_sharded_benchmark(args.matrix[0], args.matrix[1], args.shards, args.top_k)
+        else:
+            results['startup'] = run_startup_benchmark(args.repeats)
+        print()
+    
+    results['metrics'] = pipeline_metrics.snapshot()
+    if args.profile:
+        print(pipeline_metrics.profile_report(pipeline_metrics.stop_profiling()))
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+    
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_results(baseline, results, args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} metric(s) slower than baseline by more than {args.tolerance:.0%}")
+            return 1
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
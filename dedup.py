@@ -0,0 +1,170 @@
+import re
+import hashlib
+import threading
+
+from resume_parser import pipeline_metrics
+
+class MinHasher:
+    word_regex = re.compile(r'\w+')
+
+    def __init__(self, num_perm=128, shingle_size=3, seed=1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.seed = seed
+        self.hash_key = seed.to_bytes(8, 'little')
+        self.value_limit = 2 ** 64 // num_perm
+
+    def shingles(self, chunks):
+        size = self.shingle_size
+        shingles = set()
+        window = []
+        partial = ''
+        word_count = 0
+        
+        for chunk in chunks:
+            text = partial + chunk.lower()
+            words = self.word_regex.findall(text)
+            partial = words.pop() if words and self.word_regex.fullmatch(text[-1:]) else ''
+            
+            window.extend(words)
+            word_count += len(words)
+            for i in range(len(window) - size + 1):
+                shingles.add(' '.join(window[i:i + size]))
+            del window[:max(0, len(window) - size + 1)]
+        
+        if partial:
+            window.append(partial)
+            word_count += 1
+            if len(window) >= size:
+                shingles.add(' '.join(window[-size:]))
+        if word_count and word_count < size:
+            shingles.add(' '.join(window))
+        return shingles
+
+    def signature_chunks(self, chunks):
+        with pipeline_metrics.timer('dedup.signature'):
+            shingles = self.shingles(chunks)
+            if not shingles:
+                return None
+            
+            num_perm = self.num_perm
+            bins = [None] * num_perm
+            for shingle in shingles:
+                value = int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8,
+                                                       key=self.hash_key).digest(), 'little')
+                position = value % num_perm
+                value //= num_perm
+                if bins[position] is None or value < bins[position]:
+                    bins[position] = value
+            
+            signature = list(bins)
+            for position, value in enumerate(bins):
+                if value is not None:
+                    continue
+                for distance in range(1, num_perm):
+                    borrowed = bins[(position + distance) % num_perm]
+                    if borrowed is not None:
+                        signature[position] = borrowed + distance * self.value_limit
+                        break
+            return tuple(signature)
+
+    def signature(self, text):
+        return self.signature_chunks([text])
+
+    def similarity(self, first, second):
+        return sum(a == b for a, b in zip(first, second)) / self.num_perm
+
+class DuplicateIndex:
+    def __init__(self, threshold=0.8, num_perm=128, bands=16, hasher=None):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        
+        self.threshold = threshold
+        self.hasher = hasher or MinHasher(num_perm)
+        self.bands = bands
+        self.rows = self.hasher.num_perm // bands
+        self.buckets = [{} for _ in range(bands)]
+        self.signatures = {}
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.signatures)
+
+    def __contains__(self, key):
+        return key in self.signatures
+
+    def band_keys(self, signature):
+        rows = self.rows
+        return [tuple(signature[band * rows:(band + 1) * rows]) for band in range(self.bands)]
+
+    def add(self, key, signature):
+        with self.lock:
+            if key in self.signatures:
+                self.remove_locked(key)
+            self.signatures[key] = signature
+            for buckets, band_key in zip(self.buckets, self.band_keys(signature)):
+                buckets.setdefault(band_key, []).append(key)
+
+    def remove(self, key):
+        with self.lock:
+            self.remove_locked(key)
+
+    def remove_locked(self, key):
+        signature = self.signatures.pop(key)
+        for buckets, band_key in zip(self.buckets, self.band_keys(signature)):
+            keys = buckets[band_key]
+            keys.remove(key)
+            if not keys:
+                del buckets[band_key]
+
+    def clear(self):
+        with self.lock:
+            self.buckets = [{} for _ in range(self.bands)]
+            self.signatures = {}
+
+    def query(self, signature, threshold=None):
+        threshold = self.threshold if threshold is None else threshold
+        
+        with pipeline_metrics.timer('dedup.query'):
+            with self.lock:
+                candidates = set()
+                for buckets, band_key in zip(self.buckets, self.band_keys(signature)):
+                    candidates.update(buckets.get(band_key, ()))
+                
+                matches = []
+                for key in candidates:
+                    similarity = self.hasher.similarity(signature, self.signatures[key])
+                    if similarity >= threshold:
+                        matches.append((key, similarity))
+            
+            matches.sort(key=lambda match: -match[1])
+            return matches
+
+    def find(self, signature, threshold=None):
+        matches = self.query(signature, threshold)
+        if matches:
+            pipeline_metrics.increment('near_duplicates')
+            return matches[0]
+        return None
+
+    def clusters(self, threshold=None):
+        with self.lock:
+            signatures = dict(self.signatures)
+        
+        parents = {key: key for key in signatures}
+
+        def root(key):
+            while parents[key] != key:
+                parents[key] = parents[parents[key]]
+                key = parents[key]
+            return key
+        
+        for key, signature in signatures.items():
+            for other, _ in self.query(signature, threshold):
+                if other in parents:
+                    parents[root(other)] = root(key)
+        
+        groups = {}
+        for key in signatures:
+            groups.setdefault(root(key), []).append(key)
+        return [group for group in groups.values() if len(group) > 1]
\ No newline at end of file
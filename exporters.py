@@ -0,0 +1,215 @@
+import os
+import csv
+import json
+from abc import ABC, abstractmethod
+
+from resume_parser import pipeline_metrics
+
+MATCH_COLUMNS = [
+    'Job Title', 'Company', 'Location', 'Overall Score', 'Required Skills Score',
+    'Preferred Skills Score', 'Experience Score', 'Education Score', 'Required Skills',
+    'Preferred Skills', 'Experience Required', 'Education Required'
+]
+
+class ExportError(Exception):
+    pass
+
+def match_row(match, resume_name=None):
+    job = match['job']
+    scores = match['scores']
+    
+    row = {} if resume_name is None else {'Resume': resume_name}
+    row.update({
+        'Job Title': job['title'],
+        'Company': job['company'],
+        'Location': job['location'],
+        'Overall Score': scores['overall'],
+        'Required Skills Score': scores['required_skills'],
+        'Preferred Skills Score': scores['preferred_skills'],
+        'Experience Score': scores['experience'],
+        'Education Score': scores['education'],
+        'Required Skills': ', '.join(job['required_skills']),
+        'Preferred Skills': ', '.join(job['preferred_skills']),
+        'Experience Required': job['experience_required'],
+        'Education Required': ', '.join(job['education_required'])
+    })
+    return row
+
+class StreamingExporter(ABC):
+    format_name = None
+
+    def __init__(self, target, include_resume=False):
+        self.include_resume = include_resume
+        self.columns = (['Resume'] if include_resume else []) + MATCH_COLUMNS
+        self.rows_written = 0
+        
+        if hasattr(target, 'write'):
+            self.file = target
+            self.owns_file = False
+        else:
+            self.file = None
+            self.owns_file = True
+        self.target = target
+
+    @abstractmethod
+    def write_match(self, match, resume_name=None):
+        pass
+
+    def write_matches(self, matches, resume_name=None):
+        for match in matches:
+            self.write_match(match, resume_name)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+        if self.owns_file and self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+class JsonlExporter(StreamingExporter):
+    format_name = 'jsonl'
+
+    def __init__(self, target, include_resume=False):
+        super().__init__(target, include_resume)
+        if self.file is None:
+            self.file = open(target, 'w', encoding='utf-8')
+
+    def write_record(self, record):
+        self.file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self.rows_written += 1
+        pipeline_metrics.increment('rows_exported', format=self.format_name)
+
+    def write_match(self, match, resume_name=None):
+        record = {} if resume_name is None else {'resume': resume_name}
+        record['job'] = match['job']
+        record['scores'] = match['scores']
+        self.write_record(record)
+
+class JsonExporter(StreamingExporter):
+    format_name = 'json'
+
+    def __init__(self, target, include_resume=False, header=None):
+        super().__init__(target, include_resume)
+        if self.file is None:
+            self.file = open(target, 'w', encoding='utf-8')
+        self.finished = False
+        
+        self.file.write('{\n')
+        for key, value in (header or {}).items():
+            self.file.write(f"  {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)},\n")
+        self.file.write('  "job_matches": [')
+
+    def write_match(self, match, resume_name=None):
+        record = {} if resume_name is None else {'resume': resume_name}
+        record['job'] = match['job']
+        record['scores'] = match['scores']
+        self.file.write((',\n    ' if self.rows_written else '\n    ') + json.dumps(record, ensure_ascii=False))
+        self.rows_written += 1
+        pipeline_metrics.increment('rows_exported', format=self.format_name)
+
+    def close(self):
+        if self.file is not None and not self.finished:
+            self.file.write('\n  ]\n}\n' if self.rows_written else ']\n}\n')
+            self.finished = True
+        super().close()
+
+class CsvExporter(StreamingExporter):
+    format_name = 'csv'
+
+    def __init__(self, target, include_resume=False, chunk_size=10000):
+        super().__init__(target, include_resume)
+        if self.file is None:
+            self.file = open(target, 'w', encoding='utf-8', newline='')
+        self.chunk_size = chunk_size
+        self.pending = []
+        self.writer = csv.DictWriter(self.file, fieldnames=self.columns, lineterminator='\n')
+        self.writer.writeheader()
+
+    def write_match(self, match, resume_name=None):
+        self.pending.append(match_row(match, resume_name if self.include_resume else None))
+        if len(self.pending) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return
+        
+        self.writer.writerows(self.pending)
+        self.rows_written += len(self.pending)
+        pipeline_metrics.increment('rows_exported', len(self.pending), format=self.format_name)
+        self.pending = []
+
+class ParquetExporter(StreamingExporter):
+    format_name = 'parquet'
+    float_columns = ['Overall Score', 'Required Skills Score', 'Preferred Skills Score',
+                     'Experience Score', 'Education Score', 'Experience Required']
+
+    def __init__(self, target, include_resume=False, row_group_size=65536):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ExportError("Parquet export needs pyarrow (pip install pyarrow)")
+        
+        super().__init__(target, include_resume)
+        self.pyarrow = pyarrow
+        self.row_group_size = row_group_size
+        self.schema = pyarrow.schema([
+            (column, pyarrow.float64() if column in self.float_columns else pyarrow.string())
+            for column in self.columns
+        ])
+        self.pending = {column: [] for column in self.columns}
+        self.pending_count = 0
+        self.writer = pyarrow.parquet.ParquetWriter(self.file or target, self.schema)
+
+    def write_match(self, match, resume_name=None):
+        row = match_row(match, resume_name if self.include_resume else None)
+        for column in self.columns:
+            self.pending[column].append(row[column])
+        self.pending_count += 1
+        
+        if self.pending_count >= self.row_group_size:
+            self.flush()
+
+    def flush(self):
+        if not self.pending_count:
+            return
+        
+        table = self.pyarrow.table(self.pending, schema=self.schema)
+        self.writer.write_table(table, row_group_size=self.row_group_size)
+        self.rows_written += self.pending_count
+        pipeline_metrics.increment('rows_exported', self.pending_count, format=self.format_name)
+        self.pending = {column: [] for column in self.columns}
+        self.pending_count = 0
+
+    def close(self):
+        self.flush()
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+        super().close()
+
+EXPORTERS = {
+    'json': JsonExporter,
+    'jsonl': JsonlExporter,
+    'csv': CsvExporter,
+    'parquet': ParquetExporter
+}
+
+def open_exporter(target, file_format=None, **options):
+    if file_format is None:
+        file_format = os.path.splitext(str(target))[1].lstrip('.').lower()
+    
+    exporter_class = EXPORTERS.get(file_format)
+    if exporter_class is None:
+        raise ExportError(f"Unsupported export format: {file_format or 'unknown'}")
+    return exporter_class(target, **options)
\ No newline at end of file
@@ -0,0 +1,682 @@
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox, scrolledtext
+from datetime import datetime
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from resume_parser import ResumeParser, ParseCache, pipeline_metrics, parse_resume_chunk
+from job_matcher import JobMatcher
+from exporters import CsvExporter, JsonExporter, open_exporter
+from dedup import DuplicateIndex
+
+class TaskCancelled(Exception):
+    pass
+
+class BackgroundTask:
+    def __init__(self, tasks, kind, key=None):
+        self.tasks = tasks
+        self.kind = kind
+        self.key = key
+        self.cancel_event = threading.Event()
+        self.superseded = False
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def check(self):
+        if self.cancel_event.is_set():
+            raise TaskCancelled()
+
+    def progress(self, done, total, result=None):
+        self.check()
+        self.tasks.post(self, 'progress', (done, total, result))
+
+class BackgroundTasks:
+    def __init__(self, max_workers=2):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='gui-task')
+        self.messages = queue.SimpleQueue()
+        self.lock = threading.Lock()
+        self.active = {}
+        self.queued = {}
+        self.closed = False
+
+    def submit(self, kind, func, *args, key=None):
+        with self.lock:
+            queued = self.queued.get(kind)
+            for current in (self.active.get(kind), queued[0] if queued else None):
+                if key is not None and current is not None and current.key == key and not current.cancelled:
+                    pipeline_metrics.increment('gui_tasks', kind=kind, result='coalesced')
+                    return current
+            
+            task = BackgroundTask(self, kind, key)
+            if kind not in self.active:
+                self.start(task, func, args)
+                return task
+            
+            self.supersede(self.active[kind])
+            if queued:
+                self.supersede(queued[0])
+            self.queued[kind] = (task, func, args)
+            pipeline_metrics.increment('gui_tasks', kind=kind, result='queued')
+            return task
+
+    def supersede(self, task):
+        task.superseded = True
+        task.cancel()
+
+    def start(self, task, func, args):
+        self.active[task.kind] = task
+        pipeline_metrics.increment('gui_tasks', kind=task.kind, result='started')
+        self.executor.submit(self.run, task, func, args)
+
+    def run(self, task, func, args):
+        try:
+            task.check()
+            self.post(task, 'done', func(task, *args))
+        except TaskCancelled:
+            self.post(task, 'cancelled', None)
+        except Exception as e:
+            self.post(task, 'error', e)
+        finally:
+            with self.lock:
+                if self.active.get(task.kind) is task:
+                    del self.active[task.kind]
+                queued = self.queued.pop(task.kind, None)
+                if queued is not None and not self.closed:
+                    self.start(*queued)
+
+    def post(self, task, event, payload):
+        self.messages.put((task, event, payload))
+
+    def drain(self, limit=None):
+        messages = []
+        while limit is None or len(messages) < limit:
+            try:
+                messages.append(self.messages.get_nowait())
+            except queue.Empty:
+                break
+        return messages
+
+    def cancel(self, kind, discard=False):
+        with self.lock:
+            queued = self.queued.pop(kind, None)
+            if queued is not None:
+                self.supersede(queued[0])
+            if kind in self.active:
+                if discard:
+                    self.supersede(self.active[kind])
+                else:
+                    self.active[kind].cancel()
+
+    def busy(self, kind=None):
+        with self.lock:
+            if kind is None:
+                return bool(self.active or self.queued)
+            return kind in self.active or kind in self.queued
+
+    def shutdown(self):
+        with self.lock:
+            self.closed = True
+            for task, _, _ in self.queued.values():
+                self.supersede(task)
+            self.queued.clear()
+            for task in self.active.values():
+                task.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+class ResumeParserGUI:
+    poll_interval = 50
+    poll_batch = 500
+    match_page_size = 500
+    cached_match_results = 8
+    def __init__(self, root, job_store=None, text_weight=0.0):
+        self.root = root
+        self.root.title("Resume Parser & Job Matcher - Anushka Jha")
+        self.root.geometry("1200x800")
+        self.root.configure(bg='#f0f0f0')
+        
+        self.parser = ResumeParser(cache=ParseCache(), keep_text_terms=text_weight > 0)
+        self.matcher = JobMatcher(store=job_store, text_weight=text_weight)
+        self.current_resume_data = None
+        self.parsed_resumes = []
+        self.parse_failures = []
+        self.parse_duplicates = []
+        self.first_new_resume = 0
+        self.current_index = None
+        self.session = 0
+        self.duplicates = DuplicateIndex()
+        self.match_results = OrderedDict()
+        self.job_matches = None
+        self.job_matches_key = None
+        self.match_rows_loaded = 0
+        self.loading_rows = False
+        
+        self.tasks = BackgroundTasks()
+        self.setup_ui()
+        
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+        self.poll_handle = self.root.after(self.poll_interval, self.poll_tasks)
+
+    def setup_ui(self):
+        main_frame = ttk.Frame(self.root, padding="10")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        self.root.columnconfigure(0, weight=1)
+        self.root.rowconfigure(0, weight=1)
+        main_frame.columnconfigure(1, weight=1)
+        main_frame.rowconfigure(2, weight=1)
+        
+        title_label = ttk.Label(main_frame, text="Resume Parser & Job Matcher", 
+                               font=('Arial', 16, 'bold'))
+        title_label.grid(row=0, column=0, columnspan=2, pady=(0, 20))
+        
+        control_frame = ttk.LabelFrame(main_frame, text="Controls", padding="10")
+        control_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
+        
+        ttk.Button(control_frame, text="Upload Resumes", 
+                  command=self.upload_resume).grid(row=0, column=0, padx=(0, 10))
+        
+        ttk.Button(control_frame, text="Find Matching Jobs", 
+                  command=self.find_matches, state='disabled').grid(row=0, column=1, padx=(0, 10))
+        
+        ttk.Button(control_frame, text="Export Results", 
+                  command=self.export_results, state='disabled').grid(row=0, column=2, padx=(0, 10))
+        
+        ttk.Button(control_frame, text="Clear All", 
+                  command=self.clear_all).grid(row=0, column=3, padx=(0, 10))
+        
+        ttk.Button(control_frame, text="Stats", 
+                  command=self.show_stats).grid(row=0, column=4)
+        
+        self.match_button = control_frame.winfo_children()[1]
+        self.export_button = control_frame.winfo_children()[2]
+        
+        ttk.Label(control_frame, text="Resume:").grid(row=0, column=5, padx=(20, 5))
+        self.resume_selector = ttk.Combobox(control_frame, state='readonly', width=40)
+        self.resume_selector.grid(row=0, column=6)
+        self.resume_selector.bind('<<ComboboxSelected>>',
+                                  lambda event: self.select_resume(self.resume_selector.current()))
+        
+        status_frame = ttk.Frame(main_frame)
+        status_frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
+        status_frame.columnconfigure(1, weight=1)
+        
+        self.progress = ttk.Progressbar(status_frame, mode='determinate', length=300)
+        self.progress.grid(row=0, column=0, padx=(0, 10))
+        
+        self.status_label = ttk.Label(status_frame, text="Ready")
+        self.status_label.grid(row=0, column=1, sticky=tk.W)
+        
+        self.cancel_button = ttk.Button(status_frame, text="Cancel", command=self.cancel_tasks, state='disabled')
+        self.cancel_button.grid(row=0, column=2)
+        
+        content_frame = ttk.Frame(main_frame)
+        content_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
+        content_frame.columnconfigure(0, weight=1)
+        content_frame.columnconfigure(1, weight=1)
+        content_frame.rowconfigure(0, weight=1)
+        
+        self.setup_resume_panel(content_frame)
+        self.setup_jobs_panel(content_frame)
+
+    def setup_resume_panel(self, parent):
+        resume_frame = ttk.LabelFrame(parent, text="Resume Analysis", padding="10")
+        resume_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(0, 5))
+        resume_frame.columnconfigure(0, weight=1)
+        resume_frame.rowconfigure(0, weight=1)
+        
+        self.resume_text = scrolledtext.ScrolledText(resume_frame, height=20, width=50)
+        self.resume_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+    def setup_jobs_panel(self, parent):
+        jobs_frame = ttk.LabelFrame(parent, text="Job Matches", padding="10")
+        jobs_frame.grid(row=0, column=1, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(5, 0))
+        jobs_frame.columnconfigure(0, weight=1)
+        jobs_frame.rowconfigure(0, weight=1)
+        
+        self.jobs_tree = ttk.Treeview(jobs_frame, columns=('Company', 'Location', 'Score'), show='tree headings')
+        self.jobs_tree.heading('#0', text='Job Title')
+        self.jobs_tree.heading('Company', text='Company')
+        self.jobs_tree.heading('Location', text='Location')
+        self.jobs_tree.heading('Score', text='Match %')
+        
+        self.jobs_tree.column('#0', width=200)
+        self.jobs_tree.column('Company', width=150)
+        self.jobs_tree.column('Location', width=120)
+        self.jobs_tree.column('Score', width=80)
+        
+        scrollbar = ttk.Scrollbar(jobs_frame, orient=tk.VERTICAL, command=self.jobs_tree.yview)
+        self.jobs_tree.configure(yscrollcommand=lambda first, last: self.on_tree_scroll(scrollbar, first, last))
+        
+        self.jobs_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        
+        self.jobs_tree.bind('<Double-1>', self.show_job_details)
+
+    def poll_tasks(self):
+        for task, event, payload in self.tasks.drain(self.poll_batch):
+            if task.superseded:
+                if event != 'progress':
+                    self.finish_progress(self.status_label.cget('text'))
+                continue
+            if task.kind == 'parse':
+                self.handle_parse_event(task, event, payload)
+            elif task.kind == 'match':
+                self.handle_match_event(task, event, payload)
+            else:
+                self.handle_export_event(task, event, payload)
+        
+        self.poll_handle = self.root.after(self.poll_interval, self.poll_tasks)
+
+    def start_progress(self, message, total=None):
+        if total:
+            self.progress.stop()
+            self.progress.configure(mode='determinate', maximum=total, value=0)
+        else:
+            self.progress.configure(mode='indeterminate')
+            self.progress.start(10)
+        self.status_label.configure(text=message)
+        self.cancel_button.configure(state='normal')
+
+    def finish_progress(self, message):
+        if not self.tasks.busy():
+            self.progress.stop()
+            self.progress.configure(mode='determinate', value=0)
+            self.cancel_button.configure(state='disabled')
+        self.status_label.configure(text=message)
+
+    def cancel_tasks(self):
+        self.tasks.cancel('parse')
+        self.tasks.cancel('match')
+        self.status_label.configure(text="Cancelling...")
+
+    def upload_resume(self):
+        file_paths = filedialog.askopenfilenames(
+            title="Select Resume Files",
+            filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
+        )
+        
+        if file_paths:
+            self.parse_failures = []
+            self.parse_duplicates = []
+            self.first_new_resume = len(self.parsed_resumes)
+            self.start_progress(f"Parsing {len(file_paths)} resume(s)...", len(file_paths))
+            self.tasks.submit('parse', self.parse_files, list(file_paths))
+
+    def parse_files(self, task, file_paths):
+        for index, file_path in enumerate(file_paths):
+            task.check()
+            result = parse_resume_chunk([file_path], self.parser, self.duplicates.hasher)[0]
+            task.progress(index + 1, len(file_paths), result)
+        return len(file_paths)
+
+    def handle_parse_event(self, task, event, payload):
+        if event == 'progress':
+            done, total, result = payload
+            signature = result.pop('signature', None)
+            duplicate = self.duplicates.find(signature) if signature is not None else None
+            if result['error'] is not None:
+                self.parse_failures.append(result)
+            elif duplicate is not None:
+                self.parse_duplicates.append((result['path'], duplicate[0]))
+            else:
+                if signature is not None:
+                    self.duplicates.add(len(self.parsed_resumes), signature)
+                self.parsed_resumes.append(result['data'])
+            self.progress.configure(value=done)
+            self.status_label.configure(text=f"Parsed {done}/{total} resume(s)")
+            return
+        
+        if event == 'error':
+            self.finish_progress("Parsing failed")
+            messagebox.showerror("Error", f"Failed to parse resume: {str(payload)}")
+            return
+        
+        parsed = len(self.parsed_resumes) - self.first_new_resume
+        message = f"Parsed {parsed} resume(s)"
+        if self.parse_duplicates:
+            message += f", skipped {len(self.parse_duplicates)} near-duplicate(s)"
+        if self.parse_failures:
+            message += f", {len(self.parse_failures)} failed"
+        if event == 'cancelled':
+            message += " (cancelled)"
+        self.finish_progress(message)
+        
+        self.resume_selector.configure(values=[data['file_name'] for data in self.parsed_resumes])
+        if parsed:
+            self.select_resume(self.first_new_resume)
+        elif self.parse_duplicates:
+            self.select_resume(self.parse_duplicates[0][1])
+            if self.find_cached_matches():
+                message += ", reused earlier job matches"
+            self.status_label.configure(text=message)
+        elif self.parse_failures:
+            failure = self.parse_failures[0]
+            messagebox.showerror("Error", f"Failed to parse resume: {failure['error']}")
+
+    def select_resume(self, index):
+        if index < 0 or index >= len(self.parsed_resumes):
+            return
+        
+        self.current_resume_data = self.parsed_resumes[index]
+        self.current_index = index
+        self.resume_selector.current(index)
+        self.display_resume_analysis()
+        self.match_button.configure(state='normal')
+
+    def display_resume_analysis(self):
+        if not self.current_resume_data:
+            return
+        
+        self.resume_text.delete(1.0, tk.END)
+        
+        analysis = f"FILE: {self.current_resume_data['file_name']}\n"
+        analysis += "=" * 50 + "\n\n"
+        
+        contact = self.current_resume_data['contact_info']
+        if contact['emails'] or contact['phones']:
+            analysis += "CONTACT INFORMATION:\n"
+            if contact['emails']:
+                analysis += f"Emails: {', '.join(contact['emails'])}\n"
+            if contact['phones']:
+                analysis += f"Phones: {', '.join(contact['phones'])}\n"
+            analysis += "\n"
+        
+        skills = self.current_resume_data['skills']
+        analysis += "SKILLS FOUND:\n"
+        for category, skill_list in skills.items():
+            if skill_list:
+                analysis += f"{category.title()}: {', '.join(skill_list)}\n"
+        analysis += "\n"
+        
+        education = self.current_resume_data['education']
+        if any(education.values()):
+            analysis += "EDUCATION:\n"
+            for category, items in education.items():
+                if items:
+                    analysis += f"{category.title()}: {', '.join(items)}\n"
+            analysis += "\n"
+        
+        experience = self.current_resume_data['experience']
+        analysis += "EXPERIENCE:\n"
+        analysis += f"Years: {experience['years']}\n"
+        if experience['positions']:
+            analysis += f"Positions: {', '.join(experience['positions'])}\n"
+        analysis += "\n"
+        
+        analysis += "RESUME PREVIEW:\n"
+        analysis += "-" * 30 + "\n"
+        analysis += self.current_resume_data['raw_text']
+        
+        self.resume_text.insert(1.0, analysis)
+
+    def find_matches(self):
+        if not self.current_resume_data:
+            messagebox.showwarning("Warning", "Please upload a resume first!")
+            return
+        
+        key = self.match_key()
+        if key == self.job_matches_key:
+            self.status_label.configure(text="Job matches are already up to date")
+            return
+        if self.find_cached_matches():
+            self.status_label.configure(text="Reused earlier job matches")
+            return
+        
+        self.start_progress("Finding job matches...")
+        self.tasks.submit('match', self.match_resume, self.current_resume_data, key=key)
+
+    def match_key(self):
+        snapshot = self.matcher.snapshot
+        return (self.session, self.current_index, None if snapshot is None else snapshot.version)
+
+    def find_cached_matches(self):
+        key = self.match_key()
+        matches = self.match_results.get(key)
+        if matches is None:
+            return False
+        
+        self.match_results.move_to_end(key)
+        self.job_matches_key = key
+        self.display_job_matches(matches)
+        return True
+
+    def match_resume(self, task, parsed_resume):
+        return self.matcher.match_batch([parsed_resume], top_k=None)[0]
+
+    def handle_match_event(self, task, event, payload):
+        if event == 'cancelled':
+            self.finish_progress("Matching cancelled")
+        elif event == 'error':
+            self.finish_progress("Matching failed")
+            messagebox.showerror("Error", f"Matching failed: {str(payload)}")
+        elif event == 'done':
+            self.match_results[task.key] = payload
+            while len(self.match_results) > self.cached_match_results:
+                self.match_results.popitem(last=False)
+            self.job_matches_key = task.key
+            self.display_job_matches(payload)
+            self.finish_progress(f"Found {len(payload)} job matches")
+
+    def display_job_matches(self, matches):
+        self.jobs_tree.delete(*self.jobs_tree.get_children())
+        
+        self.job_matches = matches
+        self.match_rows_loaded = 0
+        self.load_more_matches()
+        
+        self.export_button.configure(state='normal')
+
+    def load_more_matches(self):
+        self.loading_rows = False
+        if self.job_matches is None:
+            return
+        
+        stop = min(self.match_rows_loaded + self.match_page_size, len(self.job_matches))
+        for index in range(self.match_rows_loaded, stop):
+            match = self.job_matches[index]
+            job = match['job']
+            score = match['scores']['overall']
+            
+            self.jobs_tree.insert('', 'end', iid=str(index),
+                                text=job['title'],
+                                values=(job['company'], job['location'], f"{score:.1f}%"))
+        self.match_rows_loaded = stop
+
+    def on_tree_scroll(self, scrollbar, first, last):
+        scrollbar.set(first, last)
+        if (self.job_matches is not None and not self.loading_rows and float(last) > 0.9
+                and self.match_rows_loaded < len(self.job_matches)):
+            self.loading_rows = True
+            self.root.after_idle(self.load_more_matches)
+
+    def show_job_details(self, event):
+        selection = self.jobs_tree.selection()
+        if not selection:
+            return
+        
+        match = self.job_matches[int(selection[0])]
+        job = match['job']
+        scores = match['scores']
+        
+        details_window = tk.Toplevel(self.root)
+        details_window.title(f"Job Details - {job['title']}")
+        details_window.geometry("600x500")
+        details_window.configure(bg='#f0f0f0')
+        
+        frame = ttk.Frame(details_window, padding="20")
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        details_text = scrolledtext.ScrolledText(frame, height=25, width=70)
+        details_text.pack(fill=tk.BOTH, expand=True)
+        
+        details = f"{job['title']}\n"
+        details += f"{job['company']} - {job['location']}\n"
+        details += "=" * 50 + "\n\n"
+        
+        details += "MATCH SCORES:\n"
+        details += f"Overall Match: {scores['overall']:.1f}%\n"
+        details += f"Required Skills: {scores['required_skills']:.1f}%\n"
+        details += f"Preferred Skills: {scores['preferred_skills']:.1f}%\n"
+        details += f"Experience: {scores['experience']:.1f}%\n"
+        details += f"Education: {scores['education']:.1f}%\n"
+        if 'text_relevance' in scores:
+            details += f"Text Relevance: {scores['text_relevance']:.1f}%\n"
+        details += "\n"
+        
+        details += "JOB REQUIREMENTS:\n"
+        details += f"Required Skills: {', '.join(job['required_skills'])}\n"
+        details += f"Preferred Skills: {', '.join(job['preferred_skills'])}\n"
+        details += f"Experience Required: {job['experience_required']} years\n"
+        details += f"Education Required: {', '.join(job['education_required'])}\n\n"
+        
+        details += "DESCRIPTION:\n"
+        details += job['description']
+        
+        details_text.insert(1.0, details)
+        details_text.configure(state='disabled')
+
+    def export_results(self):
+        if self.job_matches is None:
+            messagebox.showwarning("Warning", "No job matches to export!")
+            return
+        
+        file_path = filedialog.asksaveasfilename(
+            title="Save Results",
+            defaultextension=".json",
+            filetypes=[("JSON files", "*.json"), ("CSV files", "*.csv"), ("JSON Lines files", "*.jsonl"),
+                       ("Parquet files", "*.parquet"), ("All files", "*.*")]
+        )
+        
+        if file_path:
+            if file_path.endswith('.csv'):
+                export = self.export_to_csv
+            elif file_path.endswith(('.jsonl', '.parquet')):
+                export = self.export_matches
+            else:
+                export = self.export_to_json
+            
+            self.start_progress(f"Exporting to {file_path}...")
+            self.tasks.submit('export', self.export_file, export, file_path)
+
+    def export_file(self, task, export, file_path):
+        export(file_path)
+        return file_path
+
+    def handle_export_event(self, task, event, payload):
+        if event == 'done':
+            self.finish_progress(f"Results exported to {payload}")
+            messagebox.showinfo("Success", f"Results exported to {payload}")
+        elif event == 'error':
+            self.finish_progress("Export failed")
+            messagebox.showerror("Error", f"Export failed: {str(payload)}")
+
+    def export_to_json(self, file_path):
+        with pipeline_metrics.timer('export.json'):
+            header = {
+                'resume_analysis': self.current_resume_data,
+                'export_timestamp': datetime.now().isoformat()
+            }
+            with JsonExporter(file_path, header=header) as exporter:
+                exporter.write_matches(self.job_matches)
+
+    def export_to_csv(self, file_path):
+        with pipeline_metrics.timer('export.csv'):
+            with CsvExporter(file_path) as exporter:
+                exporter.write_matches(self.job_matches)
+
+    def export_matches(self, file_path):
+        with pipeline_metrics.timer('export.matches'):
+            with open_exporter(file_path, include_resume=True) as exporter:
+                exporter.write_matches(self.job_matches, self.current_resume_data['file_name'])
+
+    def show_stats(self):
+        window = tk.Toplevel(self.root)
+        window.title("Pipeline Stats")
+        window.geometry("700x450")
+        window.columnconfigure(0, weight=1)
+        window.rowconfigure(0, weight=1)
+        
+        stats_text = scrolledtext.ScrolledText(window, font=('Courier', 10))
+        stats_text.grid(row=0, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), padx=10, pady=10)
+        
+        def refresh():
+            stats_text.delete(1.0, tk.END)
+            stats_text.insert(1.0, self.format_stats())
+        
+        def reset():
+            pipeline_metrics.reset()
+            refresh()
+        
+        ttk.Button(window, text="Refresh", command=refresh).grid(row=1, column=0, pady=(0, 10))
+        ttk.Button(window, text="Reset", command=reset).grid(row=1, column=1, pady=(0, 10))
+        ttk.Button(window, text="Close", command=window.destroy).grid(row=1, column=2, pady=(0, 10))
+        
+        refresh()
+
+    def format_stats(self):
+        snapshot = pipeline_metrics.snapshot()
+        if not snapshot['enabled']:
+            return "Metrics collection is turned off."
+        
+        stats = f"{'Stage':<24} {'Count':>7} {'Mean ms':>9} {'p95 ms':>8} {'Total ms':>10}\n"
+        stats += "-" * 62 + "\n"
+        for stage, values in sorted(snapshot['stages'].items()):
+            stats += (f"{stage:<24} {values['count']:>7} {values['mean'] * 1000:>9.3f} "
+                      f"{values['p95'] * 1000:>8.1f} {values['sum'] * 1000:>10.1f}\n")
+        
+        if snapshot['counters']:
+            stats += "\nCOUNTERS:\n"
+            for name, value in sorted(snapshot['counters'].items()):
+                stats += f"{name}: {value}\n"
+        
+        cache_stats = self.parser.cache.stats() if self.parser.cache is not None else None
+        if cache_stats:
+            stats += "\nPARSE CACHE:\n"
+            for name, value in cache_stats.items():
+                stats += f"{name}: {value}\n"
+        
+        memo_stats = self.matcher.memo.stats() if self.matcher.memo is not None else None
+        if memo_stats:
+            stats += "\nMATCH MEMO:\n"
+            for name, value in memo_stats.items():
+                stats += f"{name}: {value}\n"
+        
+        return stats
+
+    def clear_all(self):
+        self.tasks.cancel('parse', discard=True)
+        self.tasks.cancel('match', discard=True)
+        self.current_resume_data = None
+        self.parsed_resumes = []
+        self.parse_failures = []
+        self.parse_duplicates = []
+        self.first_new_resume = 0
+        self.current_index = None
+        self.session += 1
+        self.duplicates.clear()
+        self.match_results.clear()
+        self.resume_text.delete(1.0, tk.END)
+        self.resume_selector.configure(values=[])
+        self.resume_selector.set('')
+        
+        self.jobs_tree.delete(*self.jobs_tree.get_children())
+        
+        self.match_button.configure(state='disabled')
+        self.export_button.configure(state='disabled')
+        
+        self.job_matches = None
+        self.job_matches_key = None
+        self.match_rows_loaded = 0
+        self.status_label.configure(text="Ready")
+
+    def close(self):
+        self.tasks.shutdown()
+        self.root.after_cancel(self.poll_handle)
+        self.root.destroy()
\ No newline at end of file
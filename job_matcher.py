@@ -0,0 +1,1611 @@
+import re
+import os
+import copy
+import json
+import math
+import threading
+import heapq
+import sqlite3
+import csv
+from array import array
+from collections import OrderedDict
+
+from resume_parser import pipeline_metrics, get_default_patterns, text_term_counts, text_terms
+
+np = None
+
+def load_numpy():
+    global np
+    if np is None:
+        import numpy
+        np = numpy
+    return np
+
+def blend_text(overall, text_match, text_weight):
+    return overall * (1 - text_weight) + text_match * text_weight
+
+class JobStore:
+    list_fields = ['required_skills', 'preferred_skills', 'education_required']
+    text_fields = ['title', 'company', 'location', 'description']
+
+    def __init__(self, path, taxonomy=None):
+        self.path = path
+        self.taxonomy = taxonomy
+        self.connection = None
+        self.lock = threading.Lock()
+
+    def connect(self):
+        if self.connection is None:
+            self.connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self.connection.executescript("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY,
+                    title TEXT,
+                    company TEXT,
+                    location TEXT,
+                    experience_required REAL,
+                    data TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS job_skills (
+                    job_id INTEGER NOT NULL,
+                    kind TEXT NOT NULL,
+                    skill TEXT NOT NULL,
+                    PRIMARY KEY (job_id, kind, skill)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS job_education (
+                    job_id INTEGER NOT NULL,
+                    requirement TEXT NOT NULL,
+                    PRIMARY KEY (job_id, requirement)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS jobs_location ON jobs (location);
+                CREATE INDEX IF NOT EXISTS jobs_experience ON jobs (experience_required);
+                CREATE INDEX IF NOT EXISTS job_skills_skill ON job_skills (skill, kind);
+                CREATE INDEX IF NOT EXISTS job_education_requirement ON job_education (requirement);
+            """)
+        return self.connection
+
+    def close(self):
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+    def skill_key(self, skill):
+        taxonomy = self.taxonomy if self.taxonomy is not None else get_default_patterns().taxonomy
+        return taxonomy.canonical(skill) if taxonomy is not None else skill.strip().lower()
+
+    def normalize_job(self, record):
+        job = dict(record)
+        
+        for field in self.list_fields:
+            value = job.get(field) or []
+            if isinstance(value, str):
+                value = [item.strip() for item in re.split(r'[,;|]', value) if item.strip()]
+            job[field] = list(value)
+        
+        for field in self.text_fields:
+            job[field] = job.get(field) or ''
+        
+        experience = job.get('experience_required') or 0
+        if isinstance(experience, str):
+            experience = float(experience) if '.' in experience else int(experience)
+        job['experience_required'] = experience
+        
+        if job.get('id') not in (None, ''):
+            job['id'] = int(job['id'])
+        else:
+            job['id'] = None
+        
+        return job
+
+    def import_jobs(self, records):
+        with self.lock:
+            connection = self.connect()
+            next_id = connection.execute('SELECT COALESCE(MAX(id), 0) + 1 FROM jobs').fetchone()[0]
+            count = 0
+            
+            with connection:
+                for record in records:
+                    job = self.normalize_job(record)
+                    if job['id'] is None:
+                        job['id'] = next_id
+                    next_id = max(next_id, job['id'] + 1)
+                    
+                    self.write_job(connection, job)
+                    count += 1
+            
+            return count
+
+    def write_job(self, connection, job):
+        connection.execute('DELETE FROM job_skills WHERE job_id = ?', (job['id'],))
+        connection.execute('DELETE FROM job_education WHERE job_id = ?', (job['id'],))
+        connection.execute(
+            'INSERT OR REPLACE INTO jobs (id, title, company, location, experience_required, data) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            (job['id'], job['title'], job['company'], job['location'],
+             job['experience_required'], json.dumps(job, ensure_ascii=False))
+        )
+        
+        self.write_skills(connection, job)
+        
+        requirements = set(requirement.lower() for requirement in job['education_required'])
+        connection.executemany(
+            'INSERT INTO job_education (job_id, requirement) VALUES (?, ?)',
+            [(job['id'], requirement) for requirement in requirements]
+        )
+
+    def write_skills(self, connection, job):
+        skills = []
+        for kind in ['required', 'preferred']:
+            for skill in set(self.skill_key(skill) for skill in job[f'{kind}_skills']):
+                skills.append((job['id'], kind, skill))
+        connection.executemany('INSERT INTO job_skills (job_id, kind, skill) VALUES (?, ?, ?)', skills)
+
+    def reindex_skills(self):
+        with self.lock:
+            connection = self.connect()
+            with connection:
+                connection.execute('DELETE FROM job_skills')
+                for row in connection.execute('SELECT data FROM jobs'):
+                    self.write_skills(connection, json.loads(row[0]))
+
+    def read_records(self, file_path, file_format=None):
+        file_format = file_format or os.path.splitext(file_path)[1].lstrip('.').lower()
+        
+        with open(file_path, 'r', encoding='utf-8', newline='') as file:
+            if file_format == 'csv':
+                yield from csv.DictReader(file)
+            elif file_format == 'jsonl':
+                for line in file:
+                    if line.strip():
+                        yield json.loads(line)
+            elif file_format == 'json':
+                data = json.load(file)
+                yield from (data['jobs'] if isinstance(data, dict) else data)
+            else:
+                raise ValueError(f"Unsupported job file format: {file_format}")
+
+    def import_file(self, file_path, file_format=None):
+        return self.import_jobs(self.read_records(file_path, file_format))
+
+    def remove_job(self, job_id):
+        with self.lock:
+            connection = self.connect()
+            with connection:
+                connection.execute('DELETE FROM job_skills WHERE job_id = ?', (job_id,))
+                connection.execute('DELETE FROM job_education WHERE job_id = ?', (job_id,))
+                return connection.execute('DELETE FROM jobs WHERE id = ?', (job_id,)).rowcount > 0
+
+    def count(self):
+        with self.lock:
+            return self.connect().execute('SELECT COUNT(*) FROM jobs').fetchone()[0]
+
+    def get_job(self, job_id):
+        with self.lock:
+            row = self.connect().execute('SELECT data FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def iter_jobs(self, batch_size=10000):
+        with self.lock:
+            cursor = self.connect().execute('SELECT data FROM jobs ORDER BY id')
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield json.loads(row[0])
+
+    def iter_partition(self, index, count, batch_size=10000):
+        with self.lock:
+            cursor = self.connect().execute(
+                'SELECT n, data FROM (SELECT data, ROW_NUMBER() OVER (ORDER BY id) - 1 AS n FROM jobs) '
+                'WHERE n % ? = ? ORDER BY n',
+                (count, index)
+            )
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield row[0], json.loads(row[1])
+
+    def find_jobs(self, location=None, min_experience=None, max_experience=None,
+                  education=None, skills=None, skill_kind=None, limit=None):
+        conditions = []
+        params = []
+        
+        if location is not None:
+            conditions.append('location = ?')
+            params.append(location)
+        if min_experience is not None:
+            conditions.append('experience_required >= ?')
+            params.append(min_experience)
+        if max_experience is not None:
+            conditions.append('experience_required <= ?')
+            params.append(max_experience)
+        if education:
+            placeholders = ', '.join('?' for _ in education)
+            conditions.append(f'id IN (SELECT job_id FROM job_education WHERE requirement IN ({placeholders}))')
+            params.extend(requirement.lower() for requirement in education)
+        if skills:
+            placeholders = ', '.join('?' for _ in skills)
+            kind_filter = ' AND kind = ?' if skill_kind else ''
+            conditions.append(f'id IN (SELECT job_id FROM job_skills WHERE skill IN ({placeholders}){kind_filter})')
+            params.extend(self.skill_key(skill) for skill in skills)
+            if skill_kind:
+                params.append(skill_kind)
+        
+        query = 'SELECT data FROM jobs'
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        query += ' ORDER BY id'
+        if limit is not None:
+            query += ' LIMIT ?'
+            params.append(limit)
+        
+        with self.lock:
+            rows = self.connect().execute(query, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+class JobMatrix:
+    degree_terms = ['bachelor', 'master', 'phd']
+
+    def __init__(self, jobs, skill_key=None, text=False):
+        load_numpy()
+        self.size = len(jobs)
+        self.skill_key = skill_key or str.lower
+        self.component_key = object()
+        self.skill_ids = {}
+        self.degree_ids = {}
+        self.field_ids = {}
+        self.text_ids = None
+        
+        required_pairs = []
+        preferred_pairs = []
+        degree_pairs = []
+        field_pairs = []
+        required_counts = []
+        preferred_counts = []
+        experience_required = []
+        
+        for position, job in enumerate(jobs):
+            required_skills = set(self.skill_key(skill) for skill in job['required_skills'])
+            preferred_skills = set(self.skill_key(skill) for skill in job['preferred_skills'])
+            degrees = set(deg.lower() for deg in job['education_required'] if deg in self.degree_terms)
+            fields = set(field.lower() for field in job['education_required'] if field not in self.degree_terms)
+            
+            for skill in required_skills:
+                required_pairs.append((self.term_id(self.skill_ids, skill), position))
+            for skill in preferred_skills:
+                preferred_pairs.append((self.term_id(self.skill_ids, skill), position))
+            for degree in degrees:
+                degree_pairs.append((self.term_id(self.degree_ids, degree), position))
+            for field in fields:
+                field_pairs.append((self.term_id(self.field_ids, field), position))
+            
+            required_counts.append(len(required_skills))
+            preferred_counts.append(len(preferred_skills))
+            experience_required.append(job['experience_required'])
+        
+        self.required = self.build_columns(required_pairs, len(self.skill_ids))
+        self.preferred = self.build_columns(preferred_pairs, len(self.skill_ids))
+        self.degrees = self.build_columns(degree_pairs, len(self.degree_ids))
+        self.fields = self.build_columns(field_pairs, len(self.field_ids))
+        
+        self.required_rows = self.build_rows(required_pairs)
+        self.preferred_rows = self.build_rows(preferred_pairs)
+        self.degree_rows = self.build_rows(degree_pairs)
+        self.field_rows = self.build_rows(field_pairs)
+        
+        self.required_counts = np.array(required_counts, dtype=np.int64)
+        self.preferred_counts = np.array(preferred_counts, dtype=np.int64)
+        self.experience_required = np.array(experience_required, dtype=np.float64)
+        self.has_degree_requirement = np.bincount(self.degrees[1], minlength=self.size) > 0
+        self.has_field_requirement = np.bincount(self.fields[1], minlength=self.size) > 0
+        
+        if text:
+            self.build_text(jobs)
+
+    def build_text(self, jobs):
+        vocabulary = {}
+        term_ids = array('q')
+        positions = array('q')
+        weights = array('d')
+        
+        for position, job in enumerate(jobs):
+            counts = text_term_counts(f"{job.get('title') or ''} {job.get('description') or ''}".lower())
+            if not counts:
+                continue
+            
+            term_weights = [1 + math.log(count) for count in counts.values()]
+            norm = math.sqrt(sum(weight * weight for weight in term_weights))
+            term_ids.extend([vocabulary.setdefault(term, len(vocabulary)) for term in counts])
+            weights.extend([weight / norm for weight in term_weights])
+            positions.extend([position] * len(counts))
+        
+        self.text_terms = sorted(vocabulary)
+        self.text_ids = {term: term_id for term_id, term in enumerate(self.text_terms)}
+        remap = np.zeros(len(vocabulary), dtype=np.int64)
+        remap[[vocabulary[term] for term in self.text_terms]] = np.arange(len(vocabulary))
+        
+        term_ids = remap[np.array(term_ids, dtype=np.int64)]
+        positions = np.array(positions, dtype=np.int64)
+        weights = np.array(weights, dtype=np.float64)
+        
+        order = np.lexsort((term_ids, positions))
+        term_ids, positions, weights = term_ids[order], positions[order], weights[order]
+        row_indptr = np.zeros(self.size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(positions, minlength=self.size), out=row_indptr[1:])
+        self.text_rows = (row_indptr, term_ids, weights)
+        
+        order = np.argsort(term_ids, kind='stable')
+        column_indptr = np.zeros(len(self.text_terms) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(term_ids, minlength=len(self.text_terms)), out=column_indptr[1:])
+        self.text_columns = (column_indptr, positions[order], weights[order])
+        self.text_keys = term_ids[order] * max(self.size, 1) + positions[order]
+
+    def text_statistics(self, deleted=()):
+        indptr, term_ids, _ = self.text_rows
+        counts = np.diff(self.text_columns[0])
+        if deleted:
+            removed = np.concatenate([term_ids[indptr[position]:indptr[position + 1]] for position in deleted])
+            counts = counts - np.bincount(removed, minlength=len(counts))
+        return {term: count for term, count in zip(self.text_terms, counts.tolist()) if count}
+
+    def encode_text(self, text_query):
+        term_ids = []
+        weights = []
+        for term, weight in text_query:
+            term_id = self.text_ids.get(term)
+            if term_id is not None:
+                term_ids.append(term_id)
+                weights.append(weight)
+        
+        return (
+            np.array(term_ids, dtype=np.int64),
+            np.array(weights, dtype=np.float64),
+            dict(zip(term_ids, weights))
+        )
+
+    def text_overlap(self, text, start, stop):
+        term_ids, query_weights, _ = text
+        if not len(term_ids):
+            return np.zeros(stop - start, dtype=np.float64)
+        
+        if start == 0 and stop == self.size:
+            indptr, positions, weights = self.text_columns
+            scores = np.zeros(self.size, dtype=np.float64)
+            for term_id, query_weight in zip(term_ids.tolist(), query_weights.tolist()):
+                begin, end = indptr[term_id], indptr[term_id + 1]
+                scores[positions[begin:end]] += weights[begin:end] * query_weight
+            return scores
+        
+        keys = term_ids * max(self.size, 1)
+        lower = np.searchsorted(self.text_keys, keys + start)
+        counts = np.searchsorted(self.text_keys, keys + stop) - lower
+        total = int(counts.sum())
+        if not total:
+            return np.zeros(stop - start, dtype=np.float64)
+        
+        index = np.arange(total) + np.repeat(lower - np.cumsum(counts) + counts, counts)
+        _, positions, weights = self.text_columns
+        return np.bincount(positions[index] - start, weights=weights[index] * np.repeat(query_weights, counts),
+                           minlength=stop - start)
+
+    def pair_text(self, text, position):
+        lookup = text[2]
+        indptr, term_ids, weights = self.text_rows
+        
+        total = 0.0
+        for term_id, weight in zip(term_ids[indptr[position]:indptr[position + 1]].tolist(),
+                                   weights[indptr[position]:indptr[position + 1]].tolist()):
+            query_weight = lookup.get(term_id)
+            if query_weight is not None:
+                total += weight * query_weight
+        return total * 100
+
+    def term_id(self, vocabulary, term):
+        if term not in vocabulary:
+            vocabulary[term] = len(vocabulary)
+        return vocabulary[term]
+
+    def build_columns(self, pairs, vocabulary_size):
+        term_ids = np.array([term for term, _ in pairs], dtype=np.int64)
+        positions = np.array([position for _, position in pairs], dtype=np.int64)
+        
+        order = np.argsort(term_ids, kind='stable')
+        indptr = np.zeros(vocabulary_size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(term_ids, minlength=vocabulary_size), out=indptr[1:])
+        
+        return indptr, positions[order]
+
+    def build_rows(self, pairs):
+        term_ids = np.array([term for term, _ in pairs], dtype=np.int64)
+        positions = np.array([position for _, position in pairs], dtype=np.int64)
+        
+        indptr = np.zeros(self.size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(positions, minlength=self.size), out=indptr[1:])
+        
+        return indptr, term_ids
+
+    def term_ids(self, vocabulary, terms):
+        return [vocabulary[term] for term in terms if term in vocabulary]
+
+    def overlap(self, columns, term_ids):
+        indptr, positions = columns
+        if not term_ids:
+            return np.zeros(self.size, dtype=np.int64)
+        
+        hits = np.concatenate([positions[indptr[i]:indptr[i + 1]] for i in term_ids])
+        return np.bincount(hits, minlength=self.size)
+
+    def skill_scores(self, matched, counts):
+        scores = np.zeros(self.size, dtype=np.float64)
+        np.divide(matched, counts, out=scores, where=counts > 0)
+        return scores * 100
+
+    def encode_resume(self, parsed_resume, text_query=None):
+        resume_skills = set()
+        for category_skills in parsed_resume['skills'].values():
+            resume_skills.update(self.skill_key(skill) for skill in category_skills)
+        
+        education = parsed_resume['education']
+        resume_degrees = set(deg.lower() for deg in education.get('degree', []))
+        resume_fields = set(field.lower() for field in education.get('field', []))
+        
+        encoded = {
+            'skills': self.term_ids(self.skill_ids, resume_skills),
+            'degrees': self.term_ids(self.degree_ids, resume_degrees),
+            'fields': self.term_ids(self.field_ids, resume_fields),
+            'years': parsed_resume['experience'].get('years', 0)
+        }
+        if text_query is not None:
+            encoded['text'] = self.encode_text(text_query)
+        return encoded
+
+    def experience_scores(self, years, experience_required):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            partial_experience = years / experience_required * 100
+        
+        return np.where(
+            years >= experience_required,
+            100.0,
+            np.where(years == 0, 0.0, partial_experience)
+        )
+
+    def education_scores(self, degree_match, field_match):
+        return np.where(degree_match & field_match, 100.0,
+                        np.where(degree_match | field_match, 50.0, 0.0))
+
+    def overall_scores(self, required_scores, preferred_scores, experience_scores, education_scores):
+        return (
+            required_scores * 0.4 +
+            preferred_scores * 0.2 +
+            experience_scores * 0.3 +
+            education_scores * 0.1
+        )
+
+    def with_experience(self, positions, experience_required):
+        patched = copy.copy(self)
+        patched.experience_required = self.experience_required.copy()
+        patched.experience_required[positions] = experience_required
+        return patched
+
+    def score(self, parsed_resume, memo=None, text=None, text_weight=0.0):
+        resume = self.encode_resume(parsed_resume)
+        years = resume['years']
+        
+        key = None
+        cached = None
+        if memo is not None:
+            key = (self.component_key, tuple(sorted(resume['skills'])),
+                   tuple(sorted(resume['degrees'])), tuple(sorted(resume['fields'])))
+            cached = memo.get_components(key)
+        
+        if cached is None:
+            with pipeline_metrics.timer('match.required_skills'):
+                required_scores = self.skill_scores(self.overlap(self.required, resume['skills']),
+                                                    self.required_counts)
+            with pipeline_metrics.timer('match.preferred_skills'):
+                preferred_scores = self.skill_scores(self.overlap(self.preferred, resume['skills']),
+                                                     self.preferred_counts)
+            with pipeline_metrics.timer('match.education'):
+                degree_match = ~self.has_degree_requirement | (self.overlap(self.degrees, resume['degrees']) > 0)
+                field_match = ~self.has_field_requirement | (self.overlap(self.fields, resume['fields']) > 0)
+                education_scores = self.education_scores(degree_match, field_match)
+            if memo is not None:
+                memo.put_components(key, (required_scores, preferred_scores, education_scores))
+        else:
+            required_scores, preferred_scores, education_scores = cached
+        
+        with pipeline_metrics.timer('match.experience'):
+            experience_scores = self.experience_scores(years, self.experience_required)
+        
+        with pipeline_metrics.timer('match.overall'):
+            overall_scores = self.overall_scores(required_scores, preferred_scores,
+                                                 experience_scores, education_scores)
+        
+        scores = {
+            'years': years,
+            'required_skills': required_scores,
+            'preferred_skills': preferred_scores,
+            'experience': experience_scores,
+            'education': education_scores,
+            'overall': overall_scores
+        }
+        if text is not None:
+            with pipeline_metrics.timer('match.text'):
+                scores['text'] = self.text_overlap(text, 0, self.size) * 100
+                scores['overall'] = blend_text(overall_scores, scores['text'], text_weight)
+        return scores
+
+    def round_scores(self, values):
+        rounded = np.round(values, 2)
+        scaled = values * 100
+        near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+        
+        if near_half.any():
+            rounded[near_half] = [round(value, 2) for value in values[near_half].tolist()]
+        
+        return rounded
+
+    def rank(self, overall_scores, top_k=None, positions=None, order=None):
+        if positions is None:
+            positions = np.arange(self.size)
+        
+        if top_k is not None and top_k < len(positions):
+            if top_k <= 0:
+                return positions[:0]
+            candidate_scores = overall_scores[positions]
+            threshold = np.partition(candidate_scores, len(positions) - top_k)[len(positions) - top_k]
+            positions = positions[candidate_scores >= threshold - 0.01 - 1e-9]
+        
+        rounded_scores = self.round_scores(overall_scores[positions])
+        tie_order = positions if order is None else order[positions]
+        
+        return positions[np.lexsort((tie_order, -rounded_scores))][:top_k]
+
+    def dense_block(self, rows, start, stop, local_ids):
+        indptr, term_ids = rows
+        block = np.zeros((stop - start, local_ids.max(initial=-1) + 1), dtype=np.float64)
+        
+        row_index = np.repeat(np.arange(stop - start), np.diff(indptr[start:stop + 1]))
+        column_index = local_ids[term_ids[indptr[start]:indptr[stop]]]
+        keep = column_index >= 0
+        block[row_index[keep], column_index[keep]] = 1
+        
+        return block
+
+    def encode_resumes(self, parsed_resumes, text_queries=None):
+        if text_queries is None:
+            return [self.encode_resume(parsed_resume) for parsed_resume in parsed_resumes]
+        return [self.encode_resume(parsed_resume, text_query)
+                for parsed_resume, text_query in zip(parsed_resumes, text_queries)]
+
+    def block_overlap(self, encoded_resumes, key, vocabulary_size, rows, start, stop):
+        used_ids = sorted(set(term_id for resume in encoded_resumes for term_id in resume[key]))
+        if not used_ids:
+            return np.zeros((len(encoded_resumes), stop - start), dtype=np.float64)
+        
+        local_ids = np.full(vocabulary_size, -1, dtype=np.int64)
+        local_ids[used_ids] = np.arange(len(used_ids))
+        
+        resume_block = np.zeros((len(encoded_resumes), len(used_ids)), dtype=np.float64)
+        for i, resume in enumerate(encoded_resumes):
+            resume_block[i, local_ids[resume[key]]] = 1
+        
+        return resume_block @ self.dense_block(rows, start, stop, local_ids).T
+
+    def score_block(self, encoded_resumes, start, stop, text_weight=0.0):
+        required_counts = self.required_counts[start:stop]
+        preferred_counts = self.preferred_counts[start:stop]
+        required_matched = self.block_overlap(encoded_resumes, 'skills', len(self.skill_ids),
+                                              self.required_rows, start, stop)
+        preferred_matched = self.block_overlap(encoded_resumes, 'skills', len(self.skill_ids),
+                                               self.preferred_rows, start, stop)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            required_scores = np.where(required_counts > 0, required_matched / required_counts, 0.0) * 100
+            preferred_scores = np.where(preferred_counts > 0, preferred_matched / preferred_counts, 0.0) * 100
+        
+        years, year_index = np.unique([resume['years'] for resume in encoded_resumes], return_inverse=True)
+        experience_table = self.experience_scores(years.astype(np.float64)[:, None],
+                                                  self.experience_required[start:stop])
+        
+        profiles = {}
+        profile_index = []
+        for resume in encoded_resumes:
+            profile = (tuple(sorted(resume['degrees'])), tuple(sorted(resume['fields'])))
+            profile_index.append(profiles.setdefault(profile, len(profiles)))
+        profile_resumes = [{'degrees': list(degrees), 'fields': list(fields)} for degrees, fields in profiles]
+        
+        degree_match = ~self.has_degree_requirement[start:stop] | (self.block_overlap(
+            profile_resumes, 'degrees', len(self.degree_ids), self.degree_rows, start, stop) > 0)
+        field_match = ~self.has_field_requirement[start:stop] | (self.block_overlap(
+            profile_resumes, 'fields', len(self.field_ids), self.field_rows, start, stop) > 0)
+        education_table = self.education_scores(degree_match, field_match)
+        
+        overall = (
+            required_scores * 0.4 +
+            preferred_scores * 0.2 +
+            (experience_table * 0.3)[year_index] +
+            (education_table * 0.1)[profile_index]
+        )
+        if text_weight:
+            text_scores = np.array([self.text_overlap(resume['text'], start, stop) for resume in encoded_resumes])
+            overall = blend_text(overall, text_scores.reshape(len(encoded_resumes), stop - start) * 100, text_weight)
+        return overall
+
+    def pair_components(self, resume, position):
+        resume_skills = set(resume['skills'])
+        
+        def matched(rows):
+            indptr, term_ids = rows
+            return len(resume_skills.intersection(term_ids[indptr[position]:indptr[position + 1]].tolist()))
+        
+        def requirement_met(rows, resume_terms):
+            indptr, term_ids = rows
+            required_terms = term_ids[indptr[position]:indptr[position + 1]].tolist()
+            return not required_terms or bool(set(resume_terms).intersection(required_terms))
+        
+        required_count = int(self.required_counts[position])
+        preferred_count = int(self.preferred_counts[position])
+        required_experience = self.experience_required[position].item()
+        years = resume['years']
+        
+        if years >= required_experience:
+            experience_match = 100
+        elif years == 0:
+            experience_match = 0
+        else:
+            experience_match = (years / required_experience) * 100
+        
+        degree_match = requirement_met(self.degree_rows, resume['degrees'])
+        field_match = requirement_met(self.field_rows, resume['fields'])
+        if degree_match and field_match:
+            education_match = 100
+        elif degree_match or field_match:
+            education_match = 50
+        else:
+            education_match = 0
+        
+        components = (
+            matched(self.required_rows) / required_count * 100 if required_count else 0,
+            matched(self.preferred_rows) / preferred_count * 100 if preferred_count else 0,
+            experience_match,
+            education_match
+        )
+        if 'text' in resume:
+            components += (self.pair_text(resume['text'], position),)
+        return components
+
+    def top_keys(self, keys, limit):
+        if keys.shape[1] <= limit:
+            return keys
+        
+        keep = np.argpartition(-keys, limit - 1, axis=1)[:, :limit]
+        return np.take_along_axis(keys, keep, axis=1)
+
+    def components(self, positions, scores):
+        years = scores['years']
+        required_scores = scores['required_skills'][positions].tolist()
+        preferred_scores = scores['preferred_skills'][positions].tolist()
+        experience_scores = scores['experience'][positions].tolist()
+        education_scores = scores['education'][positions].tolist()
+        required_counts = self.required_counts[positions].tolist()
+        preferred_counts = self.preferred_counts[positions].tolist()
+        experience_required = self.experience_required[positions].tolist()
+        text_scores = scores['text'][positions].tolist() if 'text' in scores else None
+        
+        components = []
+        for i in range(len(positions)):
+            if years >= experience_required[i]:
+                experience_match = 100
+            elif years == 0:
+                experience_match = 0
+            else:
+                experience_match = experience_scores[i]
+            
+            job_components = (
+                required_scores[i] if required_counts[i] else 0,
+                preferred_scores[i] if preferred_counts[i] else 0,
+                experience_match,
+                int(education_scores[i])
+            )
+            if text_scores is not None:
+                job_components += (text_scores[i],)
+            components.append(job_components)
+        
+        return components
+
+class PatchedJobs:
+    __slots__ = ('base', 'changes')
+
+    def __init__(self, base, changes):
+        self.base = base
+        self.changes = changes
+
+    def __len__(self):
+        return len(self.base)
+
+    def __getitem__(self, position):
+        job = self.changes.get(position)
+        return self.base[position] if job is None else job
+
+    def __iter__(self):
+        for position in range(len(self.base)):
+            yield self[position]
+
+class CatalogSegment:
+    def __init__(self, jobs, order, matrix=None, deleted=frozenset(), key=None, skill_key=None, text=False):
+        self.key = key if key is not None else object()
+        self.jobs = jobs
+        self.order = order
+        self.matrix = matrix if matrix is not None else JobMatrix(jobs, skill_key, text)
+        self.deleted = deleted
+        self.live_positions = None
+
+    def size(self):
+        return len(self.jobs) - len(self.deleted)
+
+    def positions(self):
+        if self.live_positions is None:
+            positions = np.ones(len(self.jobs), dtype=bool)
+            positions[list(self.deleted)] = False
+            self.live_positions = np.nonzero(positions)[0]
+        return self.live_positions
+
+    def without(self, positions):
+        return CatalogSegment(self.jobs, self.order, self.matrix, self.deleted | frozenset(positions), self.key)
+
+    def with_experience(self, changes):
+        if isinstance(self.jobs, PatchedJobs):
+            base, patched = self.jobs.base, dict(self.jobs.changes)
+        else:
+            base, patched = self.jobs, {}
+        patched.update((int(position), job) for position, job in changes)
+        jobs = PatchedJobs(base, patched)
+        if len(patched) * 2 > len(base):
+            jobs = list(jobs)
+        matrix = self.matrix.with_experience([position for position, _ in changes],
+                                             [job['experience_required'] for _, job in changes])
+        return CatalogSegment(jobs, self.order, matrix, self.deleted, self.key)
+
+    def live_entries(self):
+        return [(int(self.order[position]), self.jobs[position]) for position in self.positions()]
+
+class CatalogSnapshot:
+    def __init__(self, segments, version):
+        self.segments = tuple(segments)
+        self.version = version
+        self.compacted = None
+        self.text_stats = None
+        self.lock = threading.Lock()
+
+    def compact(self):
+        with self.lock:
+            if self.compacted is None:
+                if len(self.segments) == 1 and not self.segments[0].deleted:
+                    segment = self.segments[0]
+                else:
+                    segment = merge_segments(self.segments)
+                jobs = segment.jobs if isinstance(segment.jobs, list) else list(segment.jobs)
+                self.compacted = (jobs, segment.matrix)
+            return self.compacted
+
+    def text_statistics(self):
+        with self.lock:
+            if self.text_stats is None:
+                frequencies = {}
+                for segment in self.segments:
+                    for term, count in segment.matrix.text_statistics(segment.deleted).items():
+                        frequencies[term] = frequencies.get(term, 0) + count
+                self.text_stats = (sum(segment.size() for segment in self.segments), frequencies)
+            return self.text_stats
+
+def merge_segments(segments):
+    entries = []
+    for segment in segments:
+        entries.extend(segment.live_entries())
+    entries.sort(key=lambda entry: entry[0])
+    
+    return CatalogSegment(
+        [job for _, job in entries],
+        np.array([order for order, _ in entries], dtype=np.int64),
+        skill_key=segments[0].matrix.skill_key if segments else None,
+        text=segments[0].matrix.text_ids is not None if segments else False
+    )
+
+class MatchMemo:
+    def __init__(self, max_results=4096, max_components=256, max_component_bytes=64 * 1024 * 1024):
+        self.max_results = max_results
+        self.max_components = max_components
+        self.max_component_bytes = max_component_bytes
+        self.component_bytes = 0
+        self.results = OrderedDict()
+        self.components = OrderedDict()
+        self.version = None
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.component_hits = 0
+        self.component_misses = 0
+        self.invalidations = 0
+
+    def lookup(self, entries, key):
+        value = entries.get(key)
+        if value is not None:
+            entries.move_to_end(key)
+        return value
+
+    def insert(self, entries, key, value, limit):
+        entries[key] = value
+        entries.move_to_end(key)
+        while len(entries) > limit:
+            entries.popitem(last=False)
+
+    def check_version(self, version):
+        if self.version is None or version > self.version:
+            if self.results:
+                self.invalidations += 1
+            self.results.clear()
+            self.version = version
+        return version == self.version
+
+    def get_results(self, key, version):
+        with self.lock:
+            ranked = self.lookup(self.results, key) if self.check_version(version) else None
+            if ranked is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        pipeline_metrics.increment('match_memo', result='miss' if ranked is None else 'hit')
+        return ranked
+
+    def put_results(self, key, version, ranked):
+        with self.lock:
+            if self.check_version(version):
+                self.insert(self.results, key, ranked, self.max_results)
+
+    def get_components(self, key):
+        with self.lock:
+            components = self.lookup(self.components, key)
+            if components is None:
+                self.component_misses += 1
+            else:
+                self.component_hits += 1
+        pipeline_metrics.increment('component_memo', result='miss' if components is None else 'hit')
+        return components
+
+    def put_components(self, key, components):
+        size = sum(values.nbytes for values in components)
+        if size > self.max_component_bytes:
+            return
+        
+        with self.lock:
+            previous = self.components.pop(key, None)
+            if previous is not None:
+                self.component_bytes -= sum(values.nbytes for values in previous)
+            self.components[key] = components
+            self.component_bytes += size
+            while len(self.components) > self.max_components or self.component_bytes > self.max_component_bytes:
+                _, evicted = self.components.popitem(last=False)
+                self.component_bytes -= sum(values.nbytes for values in evicted)
+
+    def clear(self):
+        with self.lock:
+            self.results.clear()
+            self.components.clear()
+            self.component_bytes = 0
+
+    def stats(self):
+        with self.lock:
+            return {
+                'results': len(self.results),
+                'components': len(self.components),
+                'component_bytes': self.component_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'component_hits': self.component_hits,
+                'component_misses': self.component_misses,
+                'invalidations': self.invalidations,
+                'catalog_version': self.version
+            }
+
+class MatchList:
+    __slots__ = ('batch', 'start', 'stop')
+
+    def __init__(self, batch, start, stop):
+        self.batch = batch
+        self.start = start
+        self.stop = stop
+
+    def __len__(self):
+        return self.stop - self.start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.batch.match(self.start + i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("match index out of range")
+        return self.batch.match(self.start + index)
+
+    def __iter__(self):
+        for row in range(self.start, self.stop):
+            yield self.batch.match(row)
+
+    def to_list(self):
+        return list(self)
+
+class MatchBatch:
+    __slots__ = ('jobs', 'positions', 'scores', 'int_flags', 'offsets', 'keys')
+    score_keys = ('required_skills', 'preferred_skills', 'experience', 'education', 'overall')
+    text_score_keys = ('required_skills', 'preferred_skills', 'experience', 'education', 'text_relevance', 'overall')
+
+    def __init__(self, jobs, positions, scores, int_flags, offsets, keys=None):
+        self.jobs = jobs
+        self.positions = positions
+        self.scores = scores
+        self.int_flags = int_flags
+        self.offsets = offsets
+        self.keys = keys or self.score_keys
+
+    @classmethod
+    def allocate(cls, jobs, row_counts, keys=None):
+        load_numpy()
+        keys = keys or cls.score_keys
+        offsets = np.zeros(len(row_counts) + 1, dtype=np.int64)
+        np.cumsum(row_counts, out=offsets[1:])
+        rows = int(offsets[-1])
+        return cls(
+            jobs,
+            np.zeros(rows, dtype=np.int32),
+            np.zeros((rows, len(keys)), dtype=np.float32),
+            np.zeros(rows, dtype=np.uint8),
+            offsets,
+            keys
+        )
+
+    @classmethod
+    def from_matches(cls, match_lists, jobs=None):
+        match_lists = [list(matches) for matches in match_lists]
+        jobs = [] if jobs is None else list(jobs)
+        job_positions = {id(job): position for position, job in enumerate(jobs)}
+        
+        first = next((matches[0] for matches in match_lists if matches), None)
+        keys = cls.text_score_keys if first is not None and 'text_relevance' in first['scores'] else cls.score_keys
+        
+        batch = cls.allocate(jobs, [len(matches) for matches in match_lists], keys)
+        row = 0
+        for matches in match_lists:
+            for match_data in matches:
+                job = match_data['job']
+                position = job_positions.get(id(job))
+                if position is None:
+                    position = job_positions[id(job)] = len(jobs)
+                    jobs.append(job)
+                batch.set_row(row, position, [match_data['scores'][key] for key in keys], rounded=True)
+                row += 1
+        
+        return batch
+
+    def set_row(self, row, position, values, rounded=False):
+        flags = 0
+        for i, value in enumerate(values):
+            if isinstance(value, int):
+                flags |= 1 << i
+            self.scores[row, i] = value if rounded else round(value, 2)
+        
+        self.positions[row] = position
+        self.int_flags[row] = flags
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("resume index out of range")
+        return MatchList(self, int(self.offsets[index]), int(self.offsets[index + 1]))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def row_count(self):
+        return len(self.positions)
+
+    @property
+    def nbytes(self):
+        return self.positions.nbytes + self.scores.nbytes + self.int_flags.nbytes + self.offsets.nbytes
+
+    def match(self, row):
+        flags = int(self.int_flags[row])
+        values = self.scores[row].tolist()
+        
+        scores = {}
+        for i, key in enumerate(self.keys):
+            scores[key] = int(values[i]) if flags >> i & 1 else round(values[i], 2)
+        
+        return {
+            'job': self.jobs[self.positions[row]],
+            'scores': scores
+        }
+
+    def to_list(self):
+        return [matches.to_list() for matches in self]
+
+class JobMatcher:
+    def __init__(self, store=None, taxonomy=None, memo=None, text_weight=0.0, text_search=False):
+        load_numpy()
+        if isinstance(store, str):
+            store = JobStore(store, taxonomy)
+        if not 0 <= text_weight <= 1:
+            raise ValueError("text_weight must be between 0 and 1")
+        
+        self.store = store
+        self.text_weight = text_weight
+        self.text_search = text_search or text_weight > 0
+        self.text_stats = None
+        self.memo = MatchMemo() if memo is None else memo or None
+        self.taxonomy = taxonomy if taxonomy is not None else get_default_patterns().taxonomy
+        self.skill_key = self.taxonomy.canonical if self.taxonomy is not None else str.lower
+        self.snapshot = None
+        self.locations = {}
+        self.next_order = 0
+        self.write_lock = threading.RLock()
+        
+        if store is None:
+            self.load_jobs(self.load_sample_jobs())
+
+    def current_snapshot(self):
+        snapshot = self.snapshot
+        if snapshot is None:
+            with self.write_lock:
+                if self.snapshot is None:
+                    self.load_jobs(self.store.iter_jobs())
+                snapshot = self.snapshot
+        return snapshot
+
+    @property
+    def job_database(self):
+        return self.current_snapshot().compact()[0]
+
+    @job_database.setter
+    def job_database(self, jobs):
+        self.load_jobs(jobs)
+
+    @property
+    def catalog(self):
+        return self.current_snapshot().compact()[1]
+
+    @property
+    def catalog_version(self):
+        return self.current_snapshot().version
+
+    def load_jobs(self, jobs):
+        jobs = list(jobs)
+        
+        with self.write_lock:
+            segment = CatalogSegment(jobs, np.arange(len(jobs), dtype=np.int64), skill_key=self.skill_key,
+                                     text=self.text_search)
+            self.locations = {}
+            for position, job in enumerate(jobs):
+                if job.get('id') is not None:
+                    self.locations[job.get('id')] = (segment.key, position)
+            self.next_order = len(jobs)
+            version = 0 if self.snapshot is None else self.snapshot.version + 1
+            self.snapshot = CatalogSnapshot([segment], version)
+
+    def add_job(self, job):
+        return self.add_jobs([job])
+
+    def update_job(self, job):
+        return self.update_jobs([job])
+
+    def remove_job(self, job_id):
+        return self.remove_jobs([job_id])
+
+    def add_jobs(self, jobs):
+        return self.apply_changes(upserts=jobs, replace=False)
+
+    def update_jobs(self, jobs):
+        return self.apply_changes(upserts=jobs, replace=True)
+
+    def remove_jobs(self, job_ids):
+        return self.apply_changes(removals=job_ids)
+
+    def apply_changes(self, upserts=(), removals=(), replace=False):
+        upserts = list(upserts)
+        removals = list(removals)
+        
+        with self.write_lock:
+            snapshot = self.current_snapshot()
+            segments = list(snapshot.segments)
+            known_keys = set(segment.key for segment in segments)
+            deleted = {}
+            
+            seen = set()
+            for job_id in removals + [job.get('id') for job in upserts]:
+                if job_id in seen:
+                    raise ValueError(f"Duplicate job id in change set: {job_id}")
+                seen.add(job_id)
+            for job_id in removals:
+                if job_id not in self.locations:
+                    raise KeyError(f"Unknown job id: {job_id}")
+            for job in upserts:
+                if job.get('id') is None:
+                    raise ValueError("Jobs need an id to be added or updated")
+                if replace and job.get('id') not in self.locations:
+                    raise KeyError(f"Unknown job id: {job.get('id')}")
+                if not replace and job.get('id') in self.locations:
+                    raise ValueError(f"Job id already exists: {job.get('id')}")
+            
+            rebuilt = self.patch_experience(segments, upserts) if replace else upserts
+            
+            new_order = []
+            removed_ids = removals + [job.get('id') for job in rebuilt if replace]
+            for job_id in removed_ids:
+                key, position = self.locations[job_id]
+                segment = next(segment for segment in segments if segment.key is key)
+                deleted.setdefault(key, []).append(position)
+                if job_id not in removals:
+                    new_order.append(int(segment.order[position]))
+            
+            for i, segment in enumerate(segments):
+                if segment.key in deleted:
+                    segments[i] = segment.without(deleted[segment.key])
+            
+            if rebuilt:
+                if not replace:
+                    new_order = list(range(self.next_order, self.next_order + len(rebuilt)))
+                    self.next_order += len(rebuilt)
+                entries = sorted(zip(new_order, rebuilt), key=lambda entry: entry[0])
+                segments.append(CatalogSegment(
+                    [job for _, job in entries],
+                    np.array([order for order, _ in entries], dtype=np.int64),
+                    skill_key=self.skill_key,
+                    text=self.text_search
+                ))
+            
+            segments = [segment for segment in segments if segment.size() > 0]
+            segments = self.merge_tail(segments)
+            
+            for i, segment in enumerate(segments):
+                if len(segment.deleted) * 2 > len(segment.jobs):
+                    segments[i] = merge_segments([segment])
+            
+            if self.store is not None:
+                if removals:
+                    for job_id in removals:
+                        self.store.remove_job(job_id)
+                if upserts:
+                    self.store.import_jobs(upserts)
+            
+            for job_id in removed_ids:
+                del self.locations[job_id]
+            for segment in segments:
+                if segment.key not in known_keys:
+                    for position in segment.positions().tolist():
+                        job_id = segment.jobs[position].get('id')
+                        if job_id is not None:
+                            self.locations[job_id] = (segment.key, position)
+            
+            self.snapshot = CatalogSnapshot(segments, snapshot.version + 1)
+            return self.snapshot.version
+
+    def patch_experience(self, segments, jobs):
+        rebuilt = []
+        changes = {}
+        for job in jobs:
+            key, position = self.locations[job.get('id')]
+            current = next(segment for segment in segments if segment.key is key).jobs[position]
+            if ({name: value for name, value in current.items() if name != 'experience_required'} ==
+                    {name: value for name, value in job.items() if name != 'experience_required'}):
+                changes.setdefault(key, []).append((position, job))
+            else:
+                rebuilt.append(job)
+        
+        for i, segment in enumerate(segments):
+            if segment.key in changes:
+                segments[i] = segment.with_experience(changes[segment.key])
+                pipeline_metrics.increment('jobs_patched', len(changes[segment.key]))
+        return rebuilt
+
+    def profile_signature(self, parsed_resume):
+        skills = set()
+        for category_skills in parsed_resume['skills'].values():
+            skills.update(self.skill_key(skill) for skill in category_skills)
+        
+        education = parsed_resume['education']
+        signature = (
+            tuple(sorted(skills)),
+            parsed_resume['experience'].get('years', 0),
+            tuple(sorted(set(deg.lower() for deg in education.get('degree', [])))),
+            tuple(sorted(set(field.lower() for field in education.get('field', []))))
+        )
+        if self.text_weight:
+            signature += (tuple(self.resume_text_terms(parsed_resume)),)
+        return signature
+
+    def resume_text_terms(self, parsed_resume):
+        terms = parsed_resume.get('text_terms')
+        if terms is None:
+            return text_terms(parsed_resume.get('raw_text') or '')
+        return sorted(set(terms))
+
+    def text_statistics(self, snapshot):
+        return self.text_stats if self.text_stats is not None else snapshot.text_statistics()
+
+    def set_text_statistics(self, statistics):
+        self.text_stats = statistics
+        if self.memo is not None:
+            self.memo.clear()
+
+    def text_query(self, terms, statistics):
+        document_count, frequencies = statistics
+        
+        weights = []
+        for term in terms:
+            frequency = frequencies.get(term)
+            if frequency:
+                weights.append((term, math.log((1 + document_count) / (1 + frequency)) + 1))
+        
+        norm = math.sqrt(sum(weight * weight for _, weight in weights))
+        return [(term, weight / norm) for term, weight in weights]
+
+    def merge_tail(self, segments):
+        while len(segments) > 1 and segments[-1].size() * 2 >= segments[-2].size():
+            segments[-2:] = [merge_segments(segments[-2:])]
+        return segments
+
+    def load_sample_jobs(self):
+        return [
+            {
+                'id': 1,
+                'title': 'Senior Python Developer',
+                'company': 'TechCorp Inc',
+                'location': 'San Francisco, CA',
+                'required_skills': ['python', 'django', 'postgresql', 'aws', 'git'],
+                'preferred_skills': ['docker', 'kubernetes', 'redis', 'react'],
+                'experience_required': 5,
+                'education_required': ['bachelor', 'computer science'],
+                'description': 'Looking for experienced Python developer to join our backend team.'
+            },
+            {
+                'id': 2,
+                'title': 'Data Scientist',
+                'company': 'DataTech Solutions',
+                'location': 'New York, NY',
+                'required_skills': ['python', 'pandas', 'scikit-learn', 'sql', 'matplotlib'],
+                'preferred_skills': ['tensorflow', 'pytorch', 'aws', 'tableau'],
+                'experience_required': 3,
+                'education_required': ['master', 'data science'],
+                'description': 'Seeking data scientist for machine learning projects.'
+            },
+            {
+                'id': 3,
+                'title': 'Full Stack Developer',
+                'company': 'WebSolutions Ltd',
+                'location': 'Austin, TX',
+                'required_skills': ['javascript', 'react', 'node.js', 'mongodb', 'html', 'css'],
+                'preferred_skills': ['typescript', 'aws', 'docker', 'git'],
+                'experience_required': 2,
+                'education_required': ['bachelor', 'computer science'],
+                'description': 'Full stack developer for modern web applications.'
+            },
+            {
+                'id': 4,
+                'title': 'Machine Learning Engineer',
+                'company': 'AI Innovations',
+                'location': 'Seattle, WA',
+                'required_skills': ['python', 'tensorflow', 'pytorch', 'pandas', 'numpy'],
+                'preferred_skills': ['kubernetes', 'mlflow', 'aws', 'spark'],
+                'experience_required': 4,
+                'education_required': ['master', 'artificial intelligence'],
+                'description': 'ML engineer for production AI systems.'
+            },
+            {
+                'id': 5,
+                'title': 'Junior Software Developer',
+                'company': 'StartupXYZ',
+                'location': 'Remote',
+                'required_skills': ['python', 'git', 'sql'],
+                'preferred_skills': ['django', 'react', 'postgresql'],
+                'experience_required': 1,
+                'education_required': ['bachelor', 'computer science'],
+                'description': 'Entry level position for new graduates.'
+            }
+        ]
+
+    def rank_matrix(self, parsed_resumes, jobs=None, top_k=10, by='resume',
+                    resume_block_size=256, job_block_size=4096):
+        if by not in ('resume', 'job'):
+            raise ValueError(f"Unknown match_matrix direction: {by}")
+        
+        parsed_resumes = list(parsed_resumes)
+        if jobs is None:
+            snapshot = self.current_snapshot()
+            job_list, catalog = snapshot.compact()
+            statistics = self.text_statistics(snapshot) if self.text_weight else None
+        else:
+            job_list = list(jobs)
+            catalog = JobMatrix(job_list, self.skill_key, self.text_search)
+            statistics = (catalog.size, catalog.text_statistics()) if self.text_weight else None
+        
+        text_queries = None
+        if statistics is not None:
+            text_queries = [self.text_query(self.resume_text_terms(parsed_resume), statistics)
+                            for parsed_resume in parsed_resumes]
+        encoded = catalog.encode_resumes(parsed_resumes, text_queries)
+        
+        resume_count = len(encoded)
+        job_count = catalog.size
+        if by == 'resume':
+            limit = job_count if top_k is None else min(top_k, job_count)
+            outer_count, outer_block, inner_count, inner_block = resume_count, resume_block_size, job_count, job_block_size
+        else:
+            limit = resume_count if top_k is None else min(top_k, resume_count)
+            outer_count, outer_block, inner_count, inner_block = job_count, job_block_size, resume_count, resume_block_size
+        
+        if limit <= 0:
+            return job_list, catalog, encoded, [[] for _ in range(outer_count)]
+        
+        ranked = []
+        for outer_start in range(0, outer_count, outer_block):
+            outer_stop = min(outer_start + outer_block, outer_count)
+            best_keys = np.empty((outer_stop - outer_start, 0), dtype=np.int64)
+            
+            for inner_start in range(0, inner_count, inner_block):
+                inner_stop = min(inner_start + inner_block, inner_count)
+                
+                if by == 'resume':
+                    overall = catalog.score_block(encoded[outer_start:outer_stop], inner_start, inner_stop,
+                                                  self.text_weight)
+                else:
+                    overall = catalog.score_block(encoded[inner_start:inner_stop], outer_start, outer_stop,
+                                                  self.text_weight).T
+                
+                tie_keys = inner_count - 1 - np.arange(inner_start, inner_stop, dtype=np.int64)
+                if limit < overall.shape[1]:
+                    cutoff = np.partition(overall, overall.shape[1] - limit, axis=1)[:, overall.shape[1] - limit]
+                    rows, columns = np.nonzero(overall >= cutoff[:, None] - 0.01 - 1e-9)
+                else:
+                    rows, columns = np.nonzero(np.ones(overall.shape, dtype=bool))
+                
+                keys = np.full(overall.shape, -1, dtype=np.int64)
+                score_keys = np.rint(catalog.round_scores(overall[rows, columns]) * 100).astype(np.int64)
+                keys[rows, columns] = score_keys * inner_count + tie_keys[columns]
+                
+                best_keys = catalog.top_keys(np.concatenate([best_keys, keys], axis=1), limit)
+            
+            best_keys = -np.sort(-best_keys, axis=1)
+            ranked.extend((inner_count - 1 - best_keys % inner_count).tolist())
+        
+        return job_list, catalog, encoded, ranked
+
+    def match_matrix(self, parsed_resumes, jobs=None, top_k=10, by='resume',
+                     resume_block_size=256, job_block_size=4096):
+        with pipeline_metrics.timer('match.matrix'):
+            parsed_resumes = list(parsed_resumes)
+            if by == 'resume' and jobs is None and self.memo is not None:
+                return self.match_matrix_memoized(parsed_resumes, top_k, resume_block_size, job_block_size)
+            
+            job_list, catalog, encoded, ranked = self.rank_matrix(parsed_resumes, jobs, top_k, by,
+                                                                  resume_block_size, job_block_size)
+            
+            if by == 'resume':
+                results = []
+                for resume_index, positions in enumerate(ranked):
+                    results.append([
+                        self.build_match(job_list[position], *catalog.pair_components(encoded[resume_index], position))
+                        for position in positions
+                    ])
+                return results
+            
+            results = []
+            for position, resume_indexes in enumerate(ranked):
+                candidates = []
+                for resume_index in resume_indexes:
+                    match_data = self.build_match(job_list[position],
+                                                  *catalog.pair_components(encoded[resume_index], position))
+                    candidates.append({
+                        'resume_index': resume_index,
+                        'resume': parsed_resumes[resume_index],
+                        'scores': match_data['scores']
+                    })
+                results.append({'job': job_list[position], 'candidates': candidates})
+            
+            return results
+
+    def match_matrix_memoized(self, parsed_resumes, top_k, resume_block_size, job_block_size):
+        version = self.current_snapshot().version
+        
+        results = [None] * len(parsed_resumes)
+        missing = {}
+        for i, parsed_resume in enumerate(parsed_resumes):
+            key = ('matrix', self.profile_signature(parsed_resume), top_k)
+            cached = self.memo.get_results(key, version)
+            if cached is None:
+                missing.setdefault(key, []).append(i)
+            else:
+                results[i] = cached
+        
+        if missing:
+            representatives = [parsed_resumes[indexes[0]] for indexes in missing.values()]
+            job_list, catalog, encoded, ranked = self.rank_matrix(representatives, None, top_k, 'resume',
+                                                                  resume_block_size, job_block_size)
+            for (key, indexes), resume, positions in zip(missing.items(), encoded, ranked):
+                entries = [(job_list[position], catalog.pair_components(resume, position)) for position in positions]
+                self.memo.put_results(key, version, entries)
+                for i in indexes:
+                    results[i] = entries
+        
+        return [[self.build_match(job, *components) for job, components in entries] for entries in results]
+
+    def match_batch(self, parsed_resumes, jobs=None, top_k=10, resume_block_size=256, job_block_size=4096):
+        with pipeline_metrics.timer('match.batch'):
+            job_list, catalog, encoded, ranked = self.rank_matrix(parsed_resumes, jobs, top_k, 'resume',
+                                                                  resume_block_size, job_block_size)
+            batch = MatchBatch.allocate(job_list, [len(positions) for positions in ranked],
+                                        MatchBatch.text_score_keys if self.text_weight else None)
+            
+            row = 0
+            for resume_index, positions in enumerate(ranked):
+                for position in positions:
+                    components = catalog.pair_components(encoded[resume_index], position)
+                    batch.set_row(row, position, components + (self.overall_score(*components),))
+                    row += 1
+            
+            return batch
+
+    def calculate_skill_match(self, resume_skills, job_skills):
+        resume_all_skills = []
+        for category_skills in resume_skills.values():
+            resume_all_skills.extend(category_skills)
+        
+        resume_skills_set = set(self.skill_key(skill) for skill in resume_all_skills)
+        job_skills_set = set(self.skill_key(skill) for skill in job_skills)
+        
+        if not job_skills_set:
+            return 0
+        
+        matched_skills = resume_skills_set.intersection(job_skills_set)
+        return len(matched_skills) / len(job_skills_set) * 100
+
+    def calculate_experience_match(self, resume_experience, required_experience):
+        resume_years = resume_experience.get('years', 0)
+        if resume_years >= required_experience:
+            return 100
+        elif resume_years == 0:
+            return 0
+        else:
+            return (resume_years / required_experience) * 100
+
+    def calculate_education_match(self, resume_education, required_education):
+        resume_degrees = [deg.lower() for deg in resume_education.get('degree', [])]
+        resume_fields = [field.lower() for field in resume_education.get('field', [])]
+        
+        required_degrees = [deg.lower() for deg in required_education if deg in ['bachelor', 'master', 'phd']]
+        required_fields = [field.lower() for field in required_education if field not in ['bachelor', 'master', 'phd']]
+        
+        degree_match = any(deg in resume_degrees for deg in required_degrees) if required_degrees else True
+        field_match = any(field in resume_fields for field in required_fields) if required_fields else True
+        
+        if degree_match and field_match:
+            return 100
+        elif degree_match or field_match:
+            return 50
+        else:
+            return 0
+
+    def overall_score(self, required_skill_match, preferred_skill_match, experience_match, education_match,
+                      text_match=None):
+        overall = (
+            required_skill_match * 0.4 +
+            preferred_skill_match * 0.2 +
+            experience_match * 0.3 +
+            education_match * 0.1
+        )
+        if text_match is None:
+            return overall
+        return blend_text(overall, text_match, self.text_weight)
+
+    def build_match(self, job, required_skill_match, preferred_skill_match, experience_match, education_match,
+                    text_match=None):
+        overall_score = self.overall_score(
+            required_skill_match,
+            preferred_skill_match,
+            experience_match,
+            education_match,
+            text_match
+        )
+        
+        scores = {
+            'required_skills': round(required_skill_match, 2),
+            'preferred_skills': round(preferred_skill_match, 2),
+            'experience': round(experience_match, 2),
+            'education': round(education_match, 2)
+        }
+        if text_match is not None:
+            scores['text_relevance'] = round(text_match, 2)
+        scores['overall'] = round(overall_score, 2)
+        
+        return {
+            'job': job,
+            'scores': scores
+        }
+
+    def match_jobs(self, parsed_resume, top_k=None):
+        with pipeline_metrics.timer('match.jobs'):
+            snapshot = self.current_snapshot()
+            
+            key = None
+            if self.memo is not None:
+                key = ('jobs', self.profile_signature(parsed_resume), top_k)
+                cached = self.memo.get_results(key, snapshot.version)
+                if cached is not None:
+                    return [self.build_match(job, *job_components) for job, job_components in cached]
+            
+            text_query = None
+            if self.text_weight:
+                text_query = self.text_query(self.resume_text_terms(parsed_resume), self.text_statistics(snapshot))
+            
+            ranked = []
+            for segment in snapshot.segments:
+                text = segment.matrix.encode_text(text_query) if text_query is not None else None
+                scores = segment.matrix.score(parsed_resume, self.memo, text, self.text_weight)
+                pipeline_metrics.increment('jobs_scored', segment.matrix.size)
+                with pipeline_metrics.timer('match.rank'):
+                    positions = segment.matrix.rank(scores['overall'], top_k, segment.positions(), segment.order)
+                components = segment.matrix.components(positions, scores)
+                
+                for position, job_components in zip(positions, components):
+                    overall = round(self.overall_score(*job_components), 2)
+                    ranked.append(((-overall, int(segment.order[position])), segment.jobs[position], job_components))
+            
+            if len(snapshot.segments) > 1:
+                if top_k is None:
+                    ranked.sort(key=lambda entry: entry[0])
+                else:
+                    ranked = heapq.nsmallest(top_k, ranked, key=lambda entry: entry[0])
+            
+            if self.memo is not None:
+                self.memo.put_results(key, snapshot.version,
+                                      [(job, job_components) for _, job, job_components in ranked])
+            
+            matches = []
+            for _, job, job_components in ranked:
+                matches.append(self.build_match(job, *job_components))
+            
+            return matches
+
+    def search_jobs(self, text, top_k=10):
+        if not self.text_search:
+            raise ValueError("Text search needs JobMatcher(text_search=True) or a text_weight")
+        
+        with pipeline_metrics.timer('match.search'):
+            snapshot = self.current_snapshot()
+            terms = text_terms(text) if isinstance(text, str) else self.resume_text_terms(text)
+            text_query = self.text_query(terms, self.text_statistics(snapshot))
+            
+            ranked = []
+            for segment in snapshot.segments:
+                matrix = segment.matrix
+                scores = matrix.text_overlap(matrix.encode_text(text_query), 0, matrix.size) * 100
+                positions = segment.positions()
+                positions = matrix.rank(scores, top_k, positions[scores[positions] > 0], segment.order)
+                for position in positions.tolist():
+                    score = round(float(scores[position]), 2)
+                    ranked.append(((-score, int(segment.order[position])), segment.jobs[position], score))
+            
+            if top_k is None:
+                ranked.sort(key=lambda entry: entry[0])
+            else:
+                ranked = heapq.nsmallest(top_k, ranked, key=lambda entry: entry[0])
+            
+            return [{'job': job, 'score': score} for _, job, score in ranked]
\ No newline at end of file
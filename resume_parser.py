@@ -0,0 +1,1274 @@
+import re
+import os
+import json
+from collections import Counter, OrderedDict
+import threading
+import time
+import fnmatch
+import hashlib
+import sqlite3
+import bisect
+import contextlib
+import io
+import tracemalloc
+from array import array
+from types import MappingProxyType
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+class ResumeParseError(Exception):
+    pass
+
+class KeywordScanner:
+    word_char = re.compile(r'\w')
+
+    def __init__(self, pattern_groups):
+        self.categories = []
+        self.fallback_patterns = []
+        self.terms = {}
+        
+        for section, patterns in pattern_groups.items():
+            for category, pattern in patterns.items():
+                key = (section, category)
+                self.categories.append(key)
+                
+                alternatives = self.expand_pattern(pattern)
+                if alternatives is None:
+                    self.fallback_patterns.append((key, re.compile(pattern, re.IGNORECASE)))
+                    continue
+                
+                for rank, term in alternatives:
+                    ranks = self.terms.setdefault(term, {})
+                    ranks[key] = min(rank, ranks.get(key, rank))
+        
+        self.plans = self.build_plans()
+        
+        if self.terms:
+            self.regex = re.compile(r'\b(?=(' + self.build_trie_pattern(self.terms) + r')\b)')
+        else:
+            self.regex = None
+
+    def expand_pattern(self, pattern):
+        match = re.fullmatch(r'\\b\(\?:(.*)\)\\b', pattern, re.DOTALL)
+        if not match or '\\|' in match.group(1):
+            return None
+        
+        terms = []
+        for rank, alternative in enumerate(match.group(1).split('|')):
+            variants = ['']
+            i = 0
+            while i < len(alternative):
+                char = alternative[i]
+                if char == '\\':
+                    i += 1
+                    if i >= len(alternative) or alternative[i].isalnum():
+                        return None
+                    char = alternative[i]
+                elif char in '()[]{}.*+?^$':
+                    return None
+                i += 1
+                
+                if i < len(alternative) and alternative[i] == '?':
+                    variants = [variant + char for variant in variants] + variants
+                    i += 1
+                else:
+                    variants = [variant + char for variant in variants]
+            
+            for variant in variants:
+                if not variant:
+                    return None
+                terms.append((rank, variant.lower()))
+        
+        return terms
+
+    def is_boundary(self, before, after):
+        return bool(self.word_char.match(before)) != bool(self.word_char.match(after))
+
+    def build_plans(self):
+        plans = {}
+        
+        for term in self.terms:
+            best = {}
+            for length in range(1, len(term) + 1):
+                prefix = term[:length]
+                if prefix not in self.terms:
+                    continue
+                if length < len(term) and not self.is_boundary(term[length - 1], term[length]):
+                    continue
+                for key, rank in self.terms[prefix].items():
+                    if key not in best or rank < best[key][0]:
+                        best[key] = (rank, prefix)
+            
+            plans[term] = [(key, prefix) for key, (rank, prefix) in best.items()]
+        
+        return plans
+
+    def build_trie_pattern(self, words):
+        trie = {}
+        for word in words:
+            node = trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[''] = {}
+        
+        return self.trie_to_pattern(trie)
+
+    def trie_to_pattern(self, node):
+        branches = []
+        for char in sorted(node):
+            if char:
+                branches.append(re.escape(char) + self.trie_to_pattern(node[char]))
+        
+        if not branches:
+            return ''
+        
+        if len(branches) == 1 and '' not in node:
+            return branches[0]
+        
+        pattern = '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            pattern += '?'
+        
+        return pattern
+
+    def new_state(self, unique=False):
+        found = {key: set() if unique else [] for key in self.categories}
+        collect = {}
+        for key, values in found.items():
+            collect[key] = values.add if unique else values.append
+        
+        return {
+            'found': found,
+            'collect': collect,
+            'last_end': {}
+        }
+
+    def scan_range(self, text_lower, start, stop, state, offset=0):
+        collect = state['collect']
+        last_end = state['last_end']
+        
+        if self.regex is not None:
+            plans = self.plans
+            for match in self.regex.finditer(text_lower, start):
+                position = match.start()
+                if position >= stop:
+                    break
+                position += offset
+                for key, term in plans[match.group(1)]:
+                    if position >= last_end.get(key, 0):
+                        collect[key](term)
+                        last_end[key] = position + len(term)
+        
+        for key, regex in self.fallback_patterns:
+            for match in regex.finditer(text_lower, max(start, last_end.get(key, 0) - offset)):
+                if match.start() >= stop:
+                    break
+                collect[key](findall_value(match))
+                last_end[key] = max(match.end(), match.start() + 1) + offset
+
+    def scan(self, text_lower):
+        state = self.new_state()
+        self.scan_range(text_lower, 0, len(text_lower), state)
+        return state['found']
+
+def findall_value(match):
+    if match.re.groups == 0:
+        return match.group(0)
+    if match.re.groups == 1:
+        return match.group(1) or ''
+    return match.groups('')
+
+class ParseCache:
+    def __init__(self, max_entries=1024, max_bytes=64 * 1024 * 1024, path=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.path = path
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+        self.connection = None
+        
+        if path:
+            self.open_disk()
+
+    def open_disk(self):
+        self.connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS parse_cache (key TEXT PRIMARY KEY, data TEXT NOT NULL)'
+        )
+        self.connection.commit()
+
+    def __getstate__(self):
+        return {
+            'max_entries': self.max_entries,
+            'max_bytes': self.max_bytes,
+            'path': self.path
+        }
+
+    def __setstate__(self, state):
+        self.__init__(state['max_entries'], state['max_bytes'], state['path'])
+
+    def get(self, key):
+        with self.lock:
+            data = self.entries.get(key)
+            if data is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return json.loads(data)
+            
+            if self.connection is not None:
+                row = self.connection.execute(
+                    'SELECT data FROM parse_cache WHERE key = ?', (key,)
+                ).fetchone()
+                if row is not None:
+                    self.disk_hits += 1
+                    self.store(key, row[0])
+                    return json.loads(row[0])
+            
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        data = json.dumps(value, ensure_ascii=False)
+        
+        with self.lock:
+            self.store(key, data)
+            
+            if self.connection is not None:
+                try:
+                    self.connection.execute(
+                        'INSERT OR REPLACE INTO parse_cache (key, data) VALUES (?, ?)', (key, data)
+                    )
+                    self.connection.commit()
+                except sqlite3.Error:
+                    pass
+
+    def store(self, key, data):
+        if key in self.entries:
+            self.size -= len(self.entries.pop(key))
+        
+        self.entries[key] = data
+        self.size += len(data)
+        
+        while self.entries and (len(self.entries) > self.max_entries or self.size > self.max_bytes):
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= len(evicted)
+            self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+            if self.connection is not None:
+                self.connection.execute('DELETE FROM parse_cache')
+                self.connection.commit()
+
+    def stats(self):
+        with self.lock:
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self.entries),
+                'bytes': self.size
+            }
+
+    def close(self):
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+class LatencyHistogram:
+    buckets = [0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+
+    def __init__(self):
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds):
+        index = bisect.bisect_left(self.buckets, seconds)
+        self.counts[index] += 1
+        self.count += 1
+        self.total += seconds
+
+    def quantile(self, q):
+        if not self.count:
+            return 0.0
+        
+        target = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return self.buckets[i] if i < len(self.buckets) else float('inf')
+        return float('inf')
+
+    def snapshot(self):
+        return {
+            'count': self.count,
+            'sum': round(self.total, 6),
+            'buckets': {str(bound): count for bound, count in zip(self.buckets + ['+Inf'], self.counts)},
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99)
+        }
+
+class StageTimer:
+    __slots__ = ('registry', 'stage', 'start', 'outermost', 'profiling', 'memory_baseline')
+
+    def __init__(self, registry, stage):
+        self.registry = registry
+        self.stage = stage
+
+    def __enter__(self):
+        registry = self.registry
+        local = registry.local
+        depth = getattr(local, 'depth', 0)
+        local.depth = depth + 1
+        self.outermost = depth == 0
+        self.profiling = False
+        self.memory_baseline = None
+        
+        if self.outermost:
+            if registry.profiler is not None and registry.profile_lock.acquire(blocking=False):
+                self.profiling = True
+                registry.profiler.enable()
+            if registry.trace_memory and tracemalloc.is_tracing():
+                self.memory_baseline = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+        
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        elapsed = time.perf_counter() - self.start
+        registry = self.registry
+        registry.local.depth -= 1
+        
+        peak = None
+        if self.memory_baseline is not None:
+            peak = tracemalloc.get_traced_memory()[1] - self.memory_baseline
+        if self.profiling:
+            registry.profiler.disable()
+            registry.profile_lock.release()
+        
+        registry.record(self.stage, elapsed, peak)
+        if exc_type is not None:
+            registry.increment('stage_errors', stage=self.stage)
+        return False
+
+class MetricsRegistry:
+    def __init__(self, enabled=True, namespace='resume_parser'):
+        self.enabled = enabled
+        self.namespace = namespace
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.histograms = {}
+        self.peaks = {}
+        self.counters = {}
+        self.profiler = None
+        self.profile_lock = threading.Lock()
+        self.trace_memory = False
+
+    def __getstate__(self):
+        return {'enabled': self.enabled, 'namespace': self.namespace}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def timer(self, stage):
+        if not self.enabled:
+            return null_timer
+        return StageTimer(self, stage)
+
+    def record(self, stage, seconds, peak=None):
+        with self.lock:
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = self.histograms[stage] = LatencyHistogram()
+            histogram.observe(seconds)
+            if peak is not None and peak > self.peaks.get(stage, 0):
+                self.peaks[stage] = peak
+
+    def observe(self, stage, seconds):
+        if self.enabled:
+            self.record(stage, seconds)
+
+    def stage_snapshot(self, stage):
+        with self.lock:
+            return (self.histograms.get(stage) or LatencyHistogram()).snapshot()
+
+    def increment(self, name, value=1, **labels):
+        if not self.enabled:
+            return
+        
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def start_profiling(self, cpu=True, memory=False):
+        import cProfile
+        
+        if cpu and self.profiler is None:
+            self.profiler = cProfile.Profile()
+        if memory:
+            self.trace_memory = True
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+
+    def stop_profiling(self):
+        profiler, self.profiler = self.profiler, None
+        if self.trace_memory:
+            self.trace_memory = False
+            tracemalloc.stop()
+        return profiler
+
+    def profile_report(self, profiler=None, limit=25, sort='cumulative'):
+        import pstats
+        
+        profiler = profiler or self.profiler
+        if profiler is None:
+            return ''
+        
+        stream = io.StringIO()
+        pstats.Stats(profiler, stream=stream).sort_stats(sort).print_stats(limit)
+        return stream.getvalue()
+
+    def reset(self):
+        with self.lock:
+            self.histograms.clear()
+            self.peaks.clear()
+            self.counters.clear()
+        if self.profiler is not None:
+            self.profiler = type(self.profiler)()
+
+    def counter_name(self, key):
+        name, labels = key
+        if not labels:
+            return name
+        return name + '{' + ','.join(f'{label}="{value}"' for label, value in labels) + '}'
+
+    def snapshot(self):
+        with self.lock:
+            stages = {}
+            for stage, histogram in self.histograms.items():
+                stages[stage] = histogram.snapshot()
+                stages[stage]['mean'] = histogram.total / histogram.count if histogram.count else 0.0
+                if stage in self.peaks:
+                    stages[stage]['peak_bytes'] = self.peaks[stage]
+            counters = {self.counter_name(key): value for key, value in self.counters.items()}
+        
+        return {
+            'enabled': self.enabled,
+            'stages': stages,
+            'counters': counters
+        }
+
+    def prometheus(self):
+        metric = f"{self.namespace}_stage_seconds"
+        lines = [
+            f"# HELP {metric} Time spent in each parse, match and export stage.",
+            f"# TYPE {metric} histogram"
+        ]
+        
+        with self.lock:
+            for stage, histogram in sorted(self.histograms.items()):
+                cumulative = 0
+                for bound, count in zip(histogram.buckets + ['+Inf'], histogram.counts):
+                    cumulative += count
+                    lines.append(f'{metric}_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+                lines.append(f'{metric}_sum{{stage="{stage}"}} {histogram.total:.6f}')
+                lines.append(f'{metric}_count{{stage="{stage}"}} {histogram.count}')
+            
+            if self.peaks:
+                lines.append(f"# TYPE {self.namespace}_stage_peak_bytes gauge")
+                for stage, peak in sorted(self.peaks.items()):
+                    lines.append(f'{self.namespace}_stage_peak_bytes{{stage="{stage}"}} {peak}')
+            
+            declared = set()
+            for key, value in sorted(self.counters.items()):
+                name = f"{self.namespace}_{key[0]}_total"
+                if name not in declared:
+                    lines.append(f"# TYPE {name} counter")
+                    declared.add(name)
+                lines.append(f"{name}{self.counter_name(key)[len(key[0]):]} {value}")
+        
+        return '\n'.join(lines) + '\n'
+
+null_timer = contextlib.nullcontext()
+
+pipeline_metrics = MetricsRegistry()
+
+class TermTable:
+    def __init__(self, terms=()):
+        self.ids = {}
+        self.terms = []
+        self.lock = threading.Lock()
+        for term in terms:
+            self.intern(term)
+
+    def __getstate__(self):
+        return {'terms': self.terms}
+
+    def __setstate__(self, state):
+        self.__init__(state['terms'])
+
+    def intern(self, term):
+        term_id = self.ids.get(term)
+        if term_id is None:
+            with self.lock:
+                term_id = self.ids.get(term)
+                if term_id is None:
+                    term_id = self.ids[term] = len(self.terms)
+                    self.terms.append(term)
+        return term_id
+
+class ResumeVocabulary:
+    def __init__(self, layout, scanner=None):
+        self.layout = list(layout)
+        self.tables = {key: TermTable() for key in self.layout}
+        
+        if scanner is not None:
+            for term, ranks in scanner.terms.items():
+                for key in ranks:
+                    if key in self.tables:
+                        self.tables[key].intern(term)
+
+    def encode(self, parsed_resume):
+        width = len(self.layout)
+        codes = set()
+        for index, key in enumerate(self.layout):
+            table = self.tables[key]
+            codes.update(table.intern(term) * width + index for term in parsed_resume[key[0]][key[1]])
+        return array('I', sorted(codes))
+
+    def section(self, section, codes):
+        width = len(self.layout)
+        found = {category: [] for key_section, category in self.layout if key_section == section}
+        for code in codes:
+            key = self.layout[code % width]
+            if key[0] == section:
+                found[key[1]].append(self.tables[key].terms[code // width])
+        return found
+
+class CompactResume:
+    __slots__ = ('vocabulary', 'file_name', 'emails', 'phones', 'codes', 'years', 'raw_text', 'extra')
+    base_keys = ('file_name', 'contact_info', 'skills', 'education', 'experience', 'raw_text')
+
+    def __init__(self, vocabulary, file_name, emails, phones, codes, years, raw_text, extra=None):
+        self.vocabulary = vocabulary
+        self.file_name = file_name
+        self.emails = emails
+        self.phones = phones
+        self.codes = codes
+        self.years = years
+        self.raw_text = raw_text
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, parsed_resume, vocabulary):
+        contact_info = parsed_resume['contact_info']
+        extra = {key: value for key, value in parsed_resume.items() if key not in cls.base_keys}
+        
+        return cls(
+            vocabulary,
+            parsed_resume['file_name'],
+            tuple(contact_info['emails']),
+            tuple(contact_info['phones']),
+            vocabulary.encode(parsed_resume),
+            parsed_resume['experience'].get('years', 0),
+            parsed_resume['raw_text'],
+            extra or None
+        )
+
+    def __getitem__(self, key):
+        if key == 'skills' or key == 'education':
+            return self.vocabulary.section(key, self.codes)
+        if key == 'experience':
+            experience = {'years': self.years}
+            experience.update(self.vocabulary.section('experience', self.codes))
+            return experience
+        if key == 'contact_info':
+            return {'emails': list(self.emails), 'phones': list(self.phones)}
+        if key == 'file_name':
+            return self.file_name
+        if key == 'raw_text':
+            return self.raw_text
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in self.base_keys or (self.extra is not None and key in self.extra)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return list(self.base_keys) + list(self.extra or ())
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def to_dict(self):
+        return {key: self[key] for key in self.keys()}
+
+DEFAULT_SKILLS_PATTERNS = {
+    'programming': r'\b(?:python|java|javascript|c\+\+|c#|php|ruby|go|rust|swift|kotlin|scala|r|matlab|sql|html|css|react|angular|vue|node\.?js|django|flask|spring|laravel|rails|express)\b',
+    'databases': r'\b(?:mysql|postgresql|mongodb|redis|sqlite|oracle|sql server|cassandra|dynamodb|elasticsearch)\b',
+    'cloud': r'\b(?:aws|azure|gcp|google cloud|docker|kubernetes|jenkins|terraform|ansible|chef|puppet)\b',
+    'frameworks': r'\b(?:tensorflow|pytorch|scikit-learn|pandas|numpy|matplotlib|seaborn|opencv|nltk|spacy|keras|hadoop|spark|kafka|airflow)\b',
+    'tools': r'\b(?:git|github|gitlab|jira|confluence|slack|trello|figma|sketch|photoshop|illustrator|excel|powerpoint|tableau|power bi)\b',
+    'soft_skills': r'\b(?:leadership|communication|teamwork|problem solving|analytical|creative|adaptable|organized|detail oriented|time management)\b'
+}
+
+DEFAULT_EDUCATION_PATTERNS = {
+    'degree': r'\b(?:bachelor|master|phd|doctorate|diploma|certificate|b\.?tech|m\.?tech|b\.?sc|m\.?sc|b\.?com|m\.?com|mba|bba)\b',
+    'field': r'\b(?:computer science|information technology|software engineering|data science|artificial intelligence|machine learning|electrical|mechanical|civil|chemical|business|management|finance|marketing)\b'
+}
+
+DEFAULT_EXPERIENCE_PATTERNS = {
+    'years': r'(\d+)[\+\-\s]*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp)',
+    'positions': r'\b(?:software engineer|developer|programmer|analyst|manager|lead|senior|junior|intern|consultant|architect|designer|scientist|researcher)\b'
+}
+
+DEFAULT_CONTACT_PATTERNS = {
+    'emails': (r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', re.IGNORECASE),
+    'phones': (r'(?:\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}', 0)
+}
+
+TEXT_TERM_REGEX = re.compile(r'[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*')
+TEXT_TERM_CHARS = 'abcdefghijklmnopqrstuvwxyz0123456789+#.'
+TEXT_STOP_WORDS = frozenset([
+    'about', 'after', 'all', 'also', 'an', 'and', 'any', 'are', 'as', 'at', 'be', 'been', 'but', 'by',
+    'can', 'etc', 'for', 'from', 'has', 'have', 'he', 'her', 'his', 'how', 'if', 'in', 'into', 'is', 'it',
+    'its', 'me', 'more', 'my', 'no', 'not', 'of', 'on', 'or', 'our', 'out', 'over', 'she', 'so', 'such',
+    'than', 'that', 'the', 'their', 'them', 'then', 'there', 'these', 'they', 'this', 'to', 'up', 'us',
+    'was', 'we', 'were', 'what', 'when', 'where', 'which', 'while', 'who', 'will', 'with', 'would', 'you', 'your'
+])
+
+def text_term_counts(text_lower):
+    counts = Counter(TEXT_TERM_REGEX.findall(text_lower))
+    return {term: count for term, count in counts.items()
+            if len(term) > 1 and term not in TEXT_STOP_WORDS and not term.isdigit()}
+
+def text_terms(text):
+    return sorted(text_term_counts(text.lower()))
+
+class PatternRegistry:
+    def __init__(self, skills, education, experience, contact, base=None, extension=None):
+        self.base_skills_patterns = MappingProxyType(dict(skills))
+        self.education_patterns = MappingProxyType(dict(education))
+        self.experience_patterns = MappingProxyType(dict(experience))
+        self.contact_patterns = MappingProxyType(dict(contact))
+        
+        if base is None:
+            self.root = self
+            self.extensions = ()
+            self.scanners = (KeywordScanner({
+                'skills': self.base_skills_patterns,
+                'education': self.education_patterns,
+                'experience': {'positions': self.experience_patterns['positions']}
+            }),)
+            self.years_regex = re.compile(self.experience_patterns['years'], re.IGNORECASE)
+            self.contact_regexes = MappingProxyType({
+                name: re.compile(pattern, flags) for name, (pattern, flags) in self.contact_patterns.items()
+            })
+        elif hasattr(extension, 'scan_range'):
+            self.root = base.root
+            self.extensions = base.extensions + (extension,)
+            self.scanners = base.scanners + (extension,)
+            self.years_regex = base.years_regex
+            self.contact_regexes = base.contact_regexes
+        else:
+            extension = MappingProxyType(dict(extension))
+            self.root = base.root
+            self.extensions = base.extensions + (extension,)
+            self.scanners = base.scanners + (KeywordScanner({'skills': extension}),)
+            self.years_regex = base.years_regex
+            self.contact_regexes = base.contact_regexes
+        
+        self.taxonomy = None
+        skills_patterns = dict(self.base_skills_patterns)
+        for extension in self.extensions:
+            if not isinstance(extension, MappingProxyType):
+                self.taxonomy = extension
+                continue
+            for category, pattern in extension.items():
+                if category in skills_patterns:
+                    skills_patterns[category] = f"(?:{skills_patterns[category]})|(?:{pattern})"
+                else:
+                    skills_patterns[category] = pattern
+        self.skills_patterns = MappingProxyType(skills_patterns)
+        
+        self.categories = []
+        self.terms = {}
+        for scanner in self.scanners:
+            self.categories.extend(key for key in scanner.categories if key not in self.categories)
+            for term, ranks in scanner.terms.items():
+                self.terms.setdefault(term, {}).update(ranks)
+        self.skill_categories = [category for section, category in self.categories if section == 'skills']
+        
+        signature = (
+            tuple(self.base_skills_patterns.items()),
+            tuple(tuple(extension.items()) if isinstance(extension, MappingProxyType) else extension.version
+                  for extension in self.extensions),
+            tuple(self.education_patterns.items()),
+            tuple(self.experience_patterns.items()),
+            tuple(self.contact_patterns.items())
+        )
+        self.version = hashlib.sha256(repr(signature).encode('utf-8')).hexdigest()[:16]
+        
+        self.vocabulary_lock = threading.Lock()
+        self.resume_vocabulary = None
+
+    def __reduce__(self):
+        if self is builtin_patterns:
+            return (get_builtin_patterns, ())
+        if self.extensions:
+            return (rebuild_patterns, (self.root, [dict(extension) if isinstance(extension, MappingProxyType)
+                                                   else extension for extension in self.extensions]))
+        return (PatternRegistry, (dict(self.base_skills_patterns), dict(self.education_patterns),
+                                  dict(self.experience_patterns), dict(self.contact_patterns)))
+
+    @property
+    def vocabulary(self):
+        if self.resume_vocabulary is None:
+            with self.vocabulary_lock:
+                if self.resume_vocabulary is None:
+                    layout = [('skills', category) for category in self.skill_categories]
+                    layout += [('education', category) for category in self.education_patterns]
+                    layout.append(('experience', 'positions'))
+                    self.resume_vocabulary = ResumeVocabulary(layout, self)
+        return self.resume_vocabulary
+
+    def extend(self, skills):
+        return PatternRegistry(self.base_skills_patterns, self.education_patterns, self.experience_patterns,
+                               self.contact_patterns, base=self, extension=skills)
+
+    def replace(self, skills=None, education=None, experience=None, contact=None):
+        registry = PatternRegistry(
+            self.base_skills_patterns if skills is None else skills,
+            self.education_patterns if education is None else education,
+            self.experience_patterns if experience is None else experience,
+            self.contact_patterns if contact is None else contact
+        )
+        if skills is None:
+            registry = rebuild_patterns(registry, self.extensions)
+        return registry
+
+    def new_state(self, unique=False):
+        found = {key: set() if unique else [] for key in self.categories}
+        collect = {}
+        for key, values in found.items():
+            collect[key] = values.add if unique else values.append
+        
+        return {
+            'found': found,
+            'collect': collect,
+            'last_ends': [{} for _ in self.scanners]
+        }
+
+    def canonical_skills(self, skills):
+        if self.taxonomy is None:
+            return skills
+        
+        seen = set()
+        canonical = {}
+        for category, values in skills.items():
+            names = set(self.taxonomy.canonical(value) for value in values) - seen
+            seen.update(names)
+            canonical[category] = list(names)
+        return canonical
+
+    def scan_range(self, text_lower, start, stop, state, offset=0):
+        for scanner, last_end in zip(self.scanners, state['last_ends']):
+            scanner_state = {'found': state['found'], 'collect': state['collect'], 'last_end': last_end}
+            scanner.scan_range(text_lower, start, stop, scanner_state, offset)
+
+    def scan(self, text_lower):
+        if len(self.scanners) == 1:
+            return self.scanners[0].scan(text_lower)
+        
+        state = self.new_state()
+        self.scan_range(text_lower, 0, len(text_lower), state)
+        return state['found']
+
+def rebuild_patterns(registry, extensions):
+    for extension in extensions:
+        registry = registry.extend(extension)
+    return registry
+
+builtin_patterns = None
+default_patterns = None
+default_patterns_lock = threading.RLock()
+
+def get_builtin_patterns():
+    global builtin_patterns
+    if builtin_patterns is None:
+        with default_patterns_lock:
+            if builtin_patterns is None:
+                builtin_patterns = PatternRegistry(DEFAULT_SKILLS_PATTERNS, DEFAULT_EDUCATION_PATTERNS,
+                                                   DEFAULT_EXPERIENCE_PATTERNS, DEFAULT_CONTACT_PATTERNS)
+    return builtin_patterns
+
+def get_default_patterns():
+    return default_patterns or get_builtin_patterns()
+
+def set_default_patterns(registry):
+    global default_patterns
+    with default_patterns_lock:
+        default_patterns = registry
+    return registry
+
+def register_skill_taxonomy(skills):
+    with default_patterns_lock:
+        return set_default_patterns(get_default_patterns().extend(skills))
+
+class ResumeParser:
+    def __init__(self, cache=None, patterns=None, keep_text_terms=False):
+        self.patterns = patterns or get_default_patterns()
+        self.keep_text_terms = keep_text_terms
+        
+        self.stream_threshold = 8 * 1024 * 1024
+        self.stream_chunk_size = 1024 * 1024
+        self.stream_overlap = 4096
+        self.stream_max_chars = None
+        
+        self.cache = cache
+
+    @property
+    def skills_patterns(self):
+        return self.patterns.skills_patterns
+
+    @skills_patterns.setter
+    def skills_patterns(self, patterns):
+        self.patterns = self.patterns.replace(skills=patterns)
+
+    @property
+    def education_patterns(self):
+        return self.patterns.education_patterns
+
+    @education_patterns.setter
+    def education_patterns(self, patterns):
+        self.patterns = self.patterns.replace(education=patterns)
+
+    @property
+    def experience_patterns(self):
+        return self.patterns.experience_patterns
+
+    @experience_patterns.setter
+    def experience_patterns(self, patterns):
+        self.patterns = self.patterns.replace(experience=patterns)
+
+    @property
+    def contact_patterns(self):
+        return self.patterns.contact_patterns
+
+    @contact_patterns.setter
+    def contact_patterns(self, patterns):
+        self.patterns = self.patterns.replace(contact=patterns)
+
+    @property
+    def pattern_version(self):
+        return self.patterns.version
+
+    @property
+    def years_regex(self):
+        return self.patterns.years_regex
+
+    @property
+    def contact_regexes(self):
+        return self.patterns.contact_regexes
+
+    def add_skill_taxonomy(self, skills):
+        self.patterns = self.patterns.extend(skills)
+        return self.patterns
+
+    def extract_text_from_file(self, file_path):
+        with pipeline_metrics.timer('parse.read'):
+            try:
+                with open(file_path, 'r', encoding='utf-8', errors='ignore') as file:
+                    return file.read()
+            except Exception as e:
+                raise ResumeParseError(f"Error reading file: {str(e)}")
+
+    def extract_contact_info(self, text):
+        with pipeline_metrics.timer('parse.contact'):
+            emails = self.contact_regexes['emails'].findall(text)
+            phones = self.contact_regexes['phones'].findall(text)
+        
+        return {
+            'emails': emails,
+            'phones': phones
+        }
+
+    def get_keyword_scanner(self):
+        return self.patterns
+
+    def get_vocabulary(self):
+        return self.patterns.vocabulary
+
+    def compact_resume(self, parsed_data):
+        return CompactResume.from_dict(parsed_data, self.get_vocabulary())
+
+    def analyze_text(self, text):
+        scanner = self.get_keyword_scanner()
+        text_lower = text.lower()
+        with pipeline_metrics.timer('parse.keywords'):
+            found = scanner.scan(text_lower)
+        
+        if pipeline_metrics.enabled:
+            for (section, category), values in found.items():
+                if values:
+                    pipeline_metrics.increment('keyword_hits', len(values), category=f"{section}.{category}")
+        
+        skills = {}
+        for category in scanner.skill_categories:
+            skills[category] = list(set(found[('skills', category)]))
+        skills = scanner.canonical_skills(skills)
+        
+        education = {}
+        for category in self.education_patterns:
+            education[category] = list(set(found[('education', category)]))
+        
+        experience = {}
+        years_match = self.years_regex.search(text_lower)
+        if years_match:
+            experience['years'] = int(years_match.group(1))
+        else:
+            experience['years'] = 0
+        experience['positions'] = list(set(found[('experience', 'positions')]))
+        
+        return {
+            'skills': skills,
+            'education': education,
+            'experience': experience
+        }
+
+    def extract_skills(self, text):
+        with pipeline_metrics.timer('parse.skills'):
+            return self.analyze_text(text)['skills']
+
+    def extract_education(self, text):
+        with pipeline_metrics.timer('parse.education'):
+            return self.analyze_text(text)['education']
+
+    def extract_experience(self, text):
+        with pipeline_metrics.timer('parse.experience'):
+            return self.analyze_text(text)['experience']
+
+    def iter_text_chunks(self, file_path, chunk_size=None):
+        chunk_size = chunk_size or self.stream_chunk_size
+        try:
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as file:
+                while True:
+                    chunk = file.read(chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
+        except Exception as e:
+            raise ResumeParseError(f"Error reading file: {str(e)}")
+
+    def analyze_chunks(self, chunks, max_chars=None):
+        scanner = self.get_keyword_scanner()
+        overlap = self.stream_overlap
+        state = scanner.new_state(unique=True)
+        
+        contact_info = {name: [] for name in self.contact_regexes}
+        contact_ends = {name: 0 for name in self.contact_regexes}
+        years = None
+        preview = ''
+        total_length = 0
+        terms = set() if self.keep_text_terms else None
+        partial_term = ''
+        
+        window = ''
+        window_offset = 0
+        window_scanned = 0
+        lower_window = ''
+        lower_offset = 0
+        lower_scanned = 0
+        
+        chunks = iter(chunks)
+        final = False
+        while not final:
+            chunk = next(chunks, None)
+            if chunk is not None and max_chars is not None:
+                chunk = chunk[:max(0, max_chars - total_length)]
+            final = not chunk
+            chunk = chunk or ''
+            
+            if len(preview) <= 500:
+                preview += chunk[:501 - len(preview)]
+            total_length += len(chunk)
+            
+            window += chunk
+            lower_window += chunk.lower()
+            
+            if terms is not None:
+                term_text = partial_term + chunk.lower()
+                partial_term = ''
+                if not final:
+                    cut = len(term_text.rstrip(TEXT_TERM_CHARS))
+                    term_text, partial_term = term_text[:cut], term_text[cut:]
+                terms.update(text_term_counts(term_text))
+            
+            stop = len(window) if final else max(window_scanned, len(window) - overlap)
+            for name, regex in self.contact_regexes.items():
+                for match in regex.finditer(window, max(window_scanned, contact_ends[name] - window_offset)):
+                    if match.start() >= stop:
+                        break
+                    contact_info[name].append(findall_value(match))
+                    contact_ends[name] = max(match.end(), match.start() + 1) + window_offset
+            
+            lower_stop = len(lower_window) if final else max(lower_scanned, len(lower_window) - overlap)
+            scanner.scan_range(lower_window, lower_scanned, lower_stop, state, lower_offset)
+            if years is None:
+                years_match = self.years_regex.search(lower_window, lower_scanned)
+                if years_match and years_match.start() < lower_stop:
+                    years = int(years_match.group(1))
+            
+            keep = max(0, stop - 1)
+            window = window[keep:]
+            window_offset += keep
+            window_scanned = stop - keep
+            
+            keep = max(0, lower_stop - 1)
+            lower_window = lower_window[keep:]
+            lower_offset += keep
+            lower_scanned = lower_stop - keep
+        
+        found = state['found']
+        return {
+            'contact_info': contact_info,
+            'skills': scanner.canonical_skills({
+                category: list(found[('skills', category)]) for category in scanner.skill_categories
+            }),
+            'education': {category: list(found[('education', category)]) for category in self.education_patterns},
+            'experience': {
+                'years': years or 0,
+                'positions': list(found[('experience', 'positions')])
+            },
+            'raw_text': preview[:500] + '...' if total_length > 500 else preview,
+            'text_terms': None if terms is None else sorted(terms)
+        }
+
+    def parse_resume_stream(self, file_path, chunk_size=None, max_chars=None):
+        analysis = self.analyze_chunks(
+            self.iter_text_chunks(file_path, chunk_size),
+            max_chars if max_chars is not None else self.stream_max_chars
+        )
+        
+        parsed_data = {
+            'file_name': os.path.basename(file_path),
+            'contact_info': analysis['contact_info'],
+            'skills': analysis['skills'],
+            'education': analysis['education'],
+            'experience': analysis['experience'],
+            'raw_text': analysis['raw_text']
+        }
+        if analysis['text_terms'] is not None:
+            parsed_data['text_terms'] = analysis['text_terms']
+        
+        return parsed_data
+
+    def should_stream(self, file_path):
+        if self.stream_threshold is None:
+            return False
+        try:
+            return os.path.getsize(file_path) > self.stream_threshold
+        except OSError:
+            return False
+
+    def content_hash(self, file_path):
+        digest = hashlib.blake2b(digest_size=20)
+        try:
+            with open(file_path, 'rb') as file:
+                for block in iter(lambda: file.read(1024 * 1024), b''):
+                    digest.update(block)
+        except Exception as e:
+            raise ResumeParseError(f"Error reading file: {str(e)}")
+        
+        return digest.hexdigest()
+
+    def cache_key(self, file_path):
+        version = f"{self.pattern_version}:terms" if self.keep_text_terms else self.pattern_version
+        return f"{version}:{self.content_hash(file_path)}"
+
+    def parse_resume(self, file_path):
+        with pipeline_metrics.timer('parse.resume'):
+            pipeline_metrics.increment('resumes_parsed')
+            if self.cache is None:
+                return self.parse_resume_uncached(file_path)
+            
+            key = self.cache_key(file_path)
+            parsed_data = self.cache.get(key)
+            if parsed_data is not None:
+                pipeline_metrics.increment('parse_cache', result='hit')
+                parsed_data['file_name'] = os.path.basename(file_path)
+                return parsed_data
+            
+            pipeline_metrics.increment('parse_cache', result='miss')
+            parsed_data = self.parse_resume_uncached(file_path)
+            self.cache.put(key, parsed_data)
+            return parsed_data
+
+    def parse_resume_uncached(self, file_path):
+        if self.should_stream(file_path):
+            return self.parse_resume_stream(file_path)
+        
+        text = self.extract_text_from_file(file_path)
+        return self.parse_text(text, os.path.basename(file_path))
+
+    def parse_text(self, text, file_name=''):
+        analysis = self.analyze_text(text)
+        
+        parsed_data = {
+            'file_name': file_name,
+            'contact_info': self.extract_contact_info(text),
+            'skills': analysis['skills'],
+            'education': analysis['education'],
+            'experience': analysis['experience'],
+            'raw_text': text[:500] + '...' if len(text) > 500 else text
+        }
+        if self.keep_text_terms:
+            parsed_data['text_terms'] = text_terms(text)
+        
+        return parsed_data
+
+    def parse_many(self, file_paths, workers=None, chunk_size=1, report=None, hasher=None):
+        file_paths = list(file_paths)
+        chunk_size = max(1, chunk_size)
+        chunks = [file_paths[i:i + chunk_size] for i in range(0, len(file_paths), chunk_size)]
+        
+        if report is not None:
+            report.start(len(file_paths))
+        
+        if workers == 1:
+            for chunk in chunks:
+                for result in parse_resume_chunk(chunk, self, hasher):
+                    if report is not None:
+                        report.record(result)
+                    yield result
+            return
+        
+        workers = workers or os.cpu_count() or 1
+        max_pending = workers * 2
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_batch_worker,
+                                 initargs=(self,)) as executor:
+            pending = {}
+            next_chunk = 0
+            
+            while pending or next_chunk < len(chunks):
+                while next_chunk < len(chunks) and len(pending) < max_pending:
+                    future = executor.submit(parse_resume_chunk, chunks[next_chunk], None, hasher)
+                    pending[future] = chunks[next_chunk]
+                    next_chunk += 1
+                
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk = pending.pop(future)
+                    try:
+                        results = future.result()
+                    except Exception as e:
+                        results = [batch_error(file_path, e) for file_path in chunk]
+                    
+                    for result in results:
+                        if report is not None:
+                            report.record(result)
+                        yield result
+
+batch_parser = None
+
+def init_batch_worker(parser):
+    global batch_parser
+    batch_parser = parser
+
+def batch_error(file_path, error):
+    return {
+        'path': file_path,
+        'data': None,
+        'error': f"{type(error).__name__}: {str(error)}"
+    }
+
+def parse_resume_chunk(file_paths, parser=None, hasher=None):
+    parser = parser or batch_parser
+    results = []
+    
+    for file_path in file_paths:
+        try:
+            result = {
+                'path': file_path,
+                'data': parser.parse_resume(file_path),
+                'error': None
+            }
+            if hasher is not None:
+                result['signature'] = hasher.signature_chunks(parser.iter_text_chunks(file_path))
+            results.append(result)
+        except Exception as e:
+            results.append(batch_error(file_path, e))
+    
+    return results
+
+def collect_resume_files(paths, pattern='*.txt'):
+    file_paths = []
+    
+    for path in paths:
+        if os.path.isdir(path):
+            for directory, _, file_names in os.walk(path):
+                for file_name in sorted(file_names):
+                    if fnmatch.fnmatch(file_name, pattern):
+                        file_paths.append(os.path.join(directory, file_name))
+        else:
+            file_paths.append(path)
+    
+    return file_paths
+
+class BatchReport:
+    def __init__(self):
+        self.total = 0
+        self.parsed = 0
+        self.failed = 0
+        self.started_at = None
+        self.finished_at = None
+
+    def start(self, total):
+        self.total = total
+        self.started_at = time.perf_counter()
+        self.finished_at = None
+
+    def record(self, result):
+        if result['error'] is None:
+            self.parsed += 1
+        else:
+            self.failed += 1
+        
+        if self.parsed + self.failed >= self.total:
+            self.finished_at = time.perf_counter()
+
+    def elapsed(self):
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    def files_per_second(self):
+        elapsed = self.elapsed()
+        if elapsed == 0:
+            return 0.0
+        return (self.parsed + self.failed) / elapsed
+
+    def summary(self):
+        return (f"Processed {self.parsed + self.failed}/{self.total} files "
+                f"({self.parsed} parsed, {self.failed} failed) in {self.elapsed():.2f}s - "
+                f"{self.files_per_second():.1f} files/sec")
\ No newline at end of file
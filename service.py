@@ -0,0 +1,337 @@
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from http import HTTPStatus
+
+import resume_parser
+from resume_parser import ResumeParser, init_batch_worker, pipeline_metrics
+from job_matcher import JobMatcher
+from sharding import ShardedMatcher
+
+class ServiceError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+def is_string_list(values):
+    return isinstance(values, list) and all(isinstance(value, str) for value in values)
+
+def parse_text_task(text, file_name):
+    return resume_parser.batch_parser.parse_text(text, file_name)
+
+class MatchBatcher:
+    def __init__(self, matcher, executor, max_batch=32, window=0.005):
+        self.matcher = matcher
+        self.executor = executor
+        self.max_batch = max_batch
+        self.window = window
+        self.pending = []
+        self.flush_handle = None
+        self.batches = 0
+        self.batched_requests = 0
+
+    async def submit(self, parsed_resume, top_k):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((parsed_resume, top_k, future))
+        
+        if len(self.pending) >= self.max_batch:
+            self.flush()
+        elif self.flush_handle is None:
+            self.flush_handle = loop.call_later(self.window, self.flush)
+        
+        return await future
+
+    def flush(self):
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        
+        batch, self.pending = self.pending, []
+        groups = {}
+        for parsed_resume, top_k, future in batch:
+            groups.setdefault(top_k, []).append((parsed_resume, future))
+        
+        loop = asyncio.get_running_loop()
+        for top_k, entries in groups.items():
+            self.batches += 1
+            self.batched_requests += len(entries)
+            task = loop.run_in_executor(
+                self.executor,
+                self.match_group,
+                [parsed_resume for parsed_resume, _ in entries],
+                top_k
+            )
+            task.add_done_callback(lambda task, entries=entries: self.resolve(task, entries))
+
+    def match_group(self, parsed_resumes, top_k):
+        try:
+            return self.matcher.match_matrix(parsed_resumes, None, top_k)
+        except Exception as e:
+            if len(parsed_resumes) == 1:
+                return [e]
+        
+        results = []
+        for parsed_resume in parsed_resumes:
+            try:
+                results.extend(self.matcher.match_matrix([parsed_resume], None, top_k))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def resolve(self, task, entries):
+        for i, (_, future) in enumerate(entries):
+            if future.done():
+                continue
+            if task.exception() is not None:
+                future.set_exception(task.exception())
+            elif isinstance(task.result()[i], Exception):
+                future.set_exception(task.result()[i])
+            else:
+                future.set_result(task.result()[i])
+
+class MatchingService:
+    def __init__(self, parser=None, matcher=None, parse_workers=None, match_threads=2,
+                 max_in_flight=256, max_body_size=16 * 1024 * 1024, max_batch=32, batch_window=0.005):
+        self.parser = parser or ResumeParser()
+        self.matcher = matcher or JobMatcher()
+        self.max_in_flight = max_in_flight
+        self.max_body_size = max_body_size
+        self.in_flight = 0
+        self.rejected = 0
+        
+        if parse_workers == 0:
+            self.parse_executor = ThreadPoolExecutor(max_workers=1)
+            resume_parser.batch_parser = self.parser
+        else:
+            self.parse_executor = ProcessPoolExecutor(
+                max_workers=parse_workers or os.cpu_count() or 1,
+                initializer=init_batch_worker,
+                initargs=(self.parser,)
+            )
+        self.match_executor = ThreadPoolExecutor(max_workers=match_threads)
+        self.batcher = MatchBatcher(self.matcher, self.match_executor, max_batch, batch_window)
+        
+        self.routes = {
+            ('POST', '/parse'): self.parse,
+            ('POST', '/match'): self.match,
+            ('POST', '/parse-and-match'): self.parse_and_match,
+            ('GET', '/health'): self.health,
+            ('GET', '/metrics'): self.metrics,
+            ('GET', '/metrics/prometheus'): self.prometheus
+        }
+        self.unlimited_paths = ['/health', '/metrics', '/metrics/prometheus']
+
+    def close(self):
+        self.parse_executor.shutdown(wait=True, cancel_futures=True)
+        self.match_executor.shutdown(wait=True, cancel_futures=True)
+
+    def read_top_k(self, payload):
+        top_k = payload.get('top_k', 10)
+        if top_k is not None and (not isinstance(top_k, int) or isinstance(top_k, bool) or top_k < 0):
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "top_k must be a non-negative integer or null")
+        return top_k
+
+    async def parse_payload(self, payload):
+        text = payload.get('text')
+        if not isinstance(text, str):
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "Request body needs a 'text' string")
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.parse_executor,
+            parse_text_task,
+            text,
+            payload.get('file_name', '')
+        )
+
+    async def parse(self, payload):
+        return {'resume': await self.parse_payload(payload)}
+
+    def validate_resume(self, parsed_resume):
+        if not isinstance(parsed_resume, dict) or 'skills' not in parsed_resume:
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "Request body needs a parsed 'resume' object")
+        for key in ('skills', 'education', 'experience'):
+            if not isinstance(parsed_resume.get(key), dict):
+                raise ServiceError(HTTPStatus.BAD_REQUEST, f"'resume.{key}' must be an object")
+        
+        for key in ('skills', 'education', 'experience'):
+            for category, terms in parsed_resume[key].items():
+                if key == 'experience' and category == 'years':
+                    if isinstance(terms, bool) or not isinstance(terms, (int, float)):
+                        raise ServiceError(HTTPStatus.BAD_REQUEST, "'resume.experience.years' must be a number")
+                elif not is_string_list(terms):
+                    raise ServiceError(HTTPStatus.BAD_REQUEST,
+                                       f"'resume.{key}.{category}' must be a list of strings")
+        
+        if 'text_terms' in parsed_resume and not is_string_list(parsed_resume['text_terms']):
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "'resume.text_terms' must be a list of strings")
+
+    async def match(self, payload):
+        parsed_resume = payload.get('resume')
+        self.validate_resume(parsed_resume)
+        
+        return {'matches': await self.batcher.submit(parsed_resume, self.read_top_k(payload))}
+
+    async def parse_and_match(self, payload):
+        top_k = self.read_top_k(payload)
+        parsed_resume = await self.parse_payload(payload)
+        
+        return {
+            'resume': parsed_resume,
+            'matches': await self.batcher.submit(parsed_resume, top_k)
+        }
+
+    async def health(self, payload):
+        return {'status': 'ok', 'in_flight': self.in_flight}
+
+    async def metrics(self, payload):
+        return {
+            'in_flight': self.in_flight,
+            'rejected': self.rejected,
+            'match_batches': self.batcher.batches,
+            'batched_match_requests': self.batcher.batched_requests,
+            'latency': {path: pipeline_metrics.stage_snapshot(f"http {path}") for _, path in self.routes},
+            'match_memo': self.matcher.memo.stats() if self.matcher.memo is not None else None,
+            'shards': self.matcher.shard_stats() if hasattr(self.matcher, 'shard_stats') else None,
+            'pipeline': pipeline_metrics.snapshot()
+        }
+
+    async def prometheus(self, payload):
+        return pipeline_metrics.prometheus()
+
+    async def handle(self, method, target, body):
+        path = target.split('?', 1)[0]
+        route = self.routes.get((method, path))
+        if route is None:
+            if any(route_path == path for _, route_path in self.routes):
+                return HTTPStatus.METHOD_NOT_ALLOWED, {'error': f"{method} not allowed on {path}"}
+            return HTTPStatus.NOT_FOUND, {'error': f"Unknown endpoint: {path}"}
+        
+        limited = path not in self.unlimited_paths
+        if limited and self.in_flight >= self.max_in_flight:
+            self.rejected += 1
+            return HTTPStatus.SERVICE_UNAVAILABLE, {'error': "Server busy, retry later"}
+        
+        if limited:
+            self.in_flight += 1
+        started = time.perf_counter()
+        try:
+            payload = json.loads(body) if body else {}
+            if not isinstance(payload, dict):
+                raise ServiceError(HTTPStatus.BAD_REQUEST, "Request body must be a JSON object")
+            return HTTPStatus.OK, await route(payload)
+        except json.JSONDecodeError as e:
+            return HTTPStatus.BAD_REQUEST, {'error': f"Invalid JSON: {str(e)}"}
+        except ServiceError as e:
+            return e.status, {'error': str(e)}
+        except Exception as e:
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {'error': f"{type(e).__name__}: {str(e)}"}
+        finally:
+            if limited:
+                self.in_flight -= 1
+            pipeline_metrics.observe(f"http {path}", time.perf_counter() - started)
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                
+                method, target, version = request_line.decode('latin-1').split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                
+                length = int(headers.get('content-length', 0))
+                if length > self.max_body_size:
+                    await self.write_response(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                                              {'error': "Request body too large"}, False)
+                    break
+                
+                body = await reader.readexactly(length) if length else b''
+                status, payload = await self.handle(method, target, body)
+                
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                await self.write_response(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def write_response(self, writer, status, payload, keep_alive):
+        if isinstance(payload, str):
+            body = payload.encode('utf-8')
+            content_type = 'text/plain; version=0.0.4'
+        else:
+            body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+            content_type = 'application/json'
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        )
+        if status == HTTPStatus.SERVICE_UNAVAILABLE:
+            head += "Retry-After: 1\r\n"
+        
+        writer.write(head.encode('latin-1') + b"\r\n" + body)
+        await writer.drain()
+
+    async def start(self, host='127.0.0.1', port=8000):
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+class ServiceClient:
+    def __init__(self, service):
+        self.service = service
+
+    async def request(self, method, path, payload=None):
+        body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+        status, result = await self.service.handle(method, path, body)
+        if isinstance(result, str):
+            return int(status), result
+        return int(status), json.loads(json.dumps(result))
+
+    async def get(self, path):
+        return await self.request('GET', path)
+
+    async def post(self, path, payload):
+        return await self.request('POST', path, payload)
+
+async def run_service(service, host, port):
+    server = await service.start(host, port)
+    addresses = ', '.join(str(sock.getsockname()) for sock in server.sockets)
+    print(f"Serving on {addresses}")
+    async with server:
+        await server.serve_forever()
+
+def serve(host='127.0.0.1', port=8000, parse_workers=None, job_store=None, max_in_flight=256, shards=None,
+          text_weight=0.0):
+    if shards:
+        matcher = ShardedMatcher(store=job_store, shards=shards, text_weight=text_weight)
+    else:
+        matcher = JobMatcher(store=job_store, text_weight=text_weight)
+    
+    service = MatchingService(
+        parser=ResumeParser(keep_text_terms=text_weight > 0),
+        matcher=matcher,
+        parse_workers=parse_workers,
+        max_in_flight=max_in_flight
+    )
+    try:
+        asyncio.run(run_service(service, host, port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+        if shards:
+            matcher.close()
\ No newline at end of file
@@ -0,0 +1,201 @@
+import heapq
+import itertools
+import multiprocessing
+import threading
+import time
+
+from resume_parser import pipeline_metrics, get_default_patterns
+from job_matcher import JobStore, JobMatcher
+
+class ShardError(Exception):
+    pass
+
+def load_shard(jobs, store_path, index, shards):
+    if store_path is None:
+        return jobs
+    
+    store = JobStore(store_path)
+    try:
+        return list(store.iter_partition(index, shards))
+    finally:
+        store.close()
+
+def run_shard(connection, index, shards, jobs, store_path, taxonomy, text_weight):
+    try:
+        entries = load_shard(jobs, store_path, index, shards)
+        matcher = JobMatcher(taxonomy=taxonomy, memo=False, text_weight=text_weight)
+        matcher.load_jobs([job for _, job in entries])
+        orders = {id(job): order for order, job in entries}
+        statistics = matcher.text_statistics(matcher.current_snapshot()) if text_weight else None
+        connection.send(('ready', len(entries), statistics))
+    except Exception as e:
+        connection.send(('error', f"{type(e).__name__}: {str(e)}"))
+        return
+    
+    while True:
+        try:
+            message = connection.recv()
+        except EOFError:
+            break
+        if message[0] == 'stop':
+            break
+        if message[0] == 'statistics':
+            matcher.set_text_statistics(message[1])
+            continue
+        
+        _, parsed_resumes, top_k = message
+        try:
+            started = time.perf_counter()
+            results = [
+                [(-match['scores']['overall'], orders[id(match['job'])], match) for match in matches]
+                for matches in matcher.match_matrix(parsed_resumes, top_k=top_k)
+            ]
+            connection.send(('ok', results, time.perf_counter() - started))
+        except Exception as e:
+            connection.send(('error', f"{type(e).__name__}: {str(e)}"))
+    
+    connection.close()
+
+class ShardedMatcher:
+    def __init__(self, jobs=None, store=None, shards=None, taxonomy=None, start_method=None, text_weight=0.0):
+        if jobs is not None and store is not None:
+            raise ValueError("Pass either jobs or a job store path, not both")
+        if jobs is None and store is None:
+            jobs = JobMatcher(memo=False).job_database
+        
+        self.shards = shards or multiprocessing.cpu_count() or 1
+        self.taxonomy = taxonomy if taxonomy is not None else get_default_patterns().taxonomy
+        self.memo = None
+        self.text_weight = text_weight
+        self.lock = threading.Lock()
+        self.shard_sizes = []
+        self.shard_requests = [0] * self.shards
+        self.shard_seconds = [0.0] * self.shards
+        self.last_timings = []
+        
+        if start_method is None:
+            start_method = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn'
+        context = multiprocessing.get_context(start_method)
+        
+        if jobs is not None:
+            jobs = list(jobs)
+            bounds = [len(jobs) * index // self.shards for index in range(self.shards + 1)]
+            partitions = [list(zip(range(bounds[index], bounds[index + 1]), jobs[bounds[index]:bounds[index + 1]]))
+                          for index in range(self.shards)]
+        else:
+            partitions = [None] * self.shards
+        
+        self.connections = []
+        self.processes = []
+        try:
+            for index in range(self.shards):
+                parent, child = context.Pipe()
+                process = context.Process(
+                    target=run_shard,
+                    args=(child, index, self.shards, partitions[index], store, self.taxonomy, text_weight),
+                    name=f"job-shard-{index}",
+                    daemon=True
+                )
+                process.start()
+                child.close()
+                self.connections.append(parent)
+                self.processes.append(process)
+            
+            document_count = 0
+            frequencies = {}
+            for index, connection in enumerate(self.connections):
+                status, *payload = self.receive(index, connection)
+                if status != 'ready':
+                    raise ShardError(f"Shard {index} failed to load: {payload[0]}")
+                size, statistics = payload
+                self.shard_sizes.append(size)
+                if statistics is not None:
+                    document_count += statistics[0]
+                    for term, count in statistics[1].items():
+                        frequencies[term] = frequencies.get(term, 0) + count
+            
+            if text_weight:
+                for connection in self.connections:
+                    connection.send(('statistics', (document_count, frequencies)))
+        except BaseException:
+            self.close()
+            raise
+
+    def receive(self, index, connection):
+        try:
+            return connection.recv()
+        except (EOFError, OSError):
+            raise ShardError(f"Shard {index} exited unexpectedly")
+
+    def match_matrix(self, parsed_resumes, jobs=None, top_k=10, by='resume'):
+        if jobs is not None or by != 'resume':
+            raise ValueError("ShardedMatcher only ranks jobs per resume over its own catalog")
+        
+        parsed_resumes = [dict(parsed_resume) for parsed_resume in parsed_resumes]
+        with pipeline_metrics.timer('match.sharded'):
+            with self.lock:
+                for connection in self.connections:
+                    connection.send(('match', parsed_resumes, top_k))
+                
+                replies = []
+                timings = []
+                errors = []
+                for index, connection in enumerate(self.connections):
+                    status, *payload = self.receive(index, connection)
+                    if status != 'ok':
+                        errors.append(f"shard {index}: {payload[0]}")
+                        continue
+                    results, seconds = payload
+                    replies.append(results)
+                    timings.append(seconds)
+                    self.shard_requests[index] += 1
+                    self.shard_seconds[index] += seconds
+                    pipeline_metrics.observe(f"match.shard.{index}", seconds)
+                
+                if errors:
+                    raise ShardError("Sharded match failed: " + "; ".join(errors))
+                self.last_timings = timings
+            
+            with pipeline_metrics.timer('match.merge'):
+                merged = []
+                for shard_results in zip(*replies):
+                    ranked = heapq.merge(*shard_results, key=lambda entry: entry[:2])
+                    merged.append([match for _, _, match in itertools.islice(ranked, top_k)])
+                return merged
+
+    def match_jobs(self, parsed_resume, top_k=None):
+        return self.match_matrix([parsed_resume], top_k=top_k)[0]
+
+    def shard_stats(self):
+        return [
+            {
+                'shard': index,
+                'jobs': self.shard_sizes[index],
+                'requests': self.shard_requests[index],
+                'seconds': self.shard_seconds[index],
+                'last_seconds': self.last_timings[index] if index < len(self.last_timings) else None
+            }
+            for index in range(len(self.shard_sizes))
+        ]
+
+    def close(self):
+        for connection in self.connections:
+            try:
+                connection.send(('stop',))
+            except (OSError, ValueError):
+                pass
+        for process in self.processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        for connection in self.connections:
+            connection.close()
+        self.connections = []
+        self.processes = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
\ No newline at end of file
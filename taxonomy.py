@@ -0,0 +1,227 @@
+import os
+import re
+import csv
+import json
+import hashlib
+
+class TaxonomyError(Exception):
+    pass
+
+class SkillTaxonomy:
+    token_regex = re.compile(r'\.?[\w+#]+(?:[.\-][\w+#]+)*')
+    separators = str.maketrans('', '', '.-_')
+    phrase_gap = ' \t\r\n/'
+
+    def __init__(self, entries=(), default_category='other'):
+        self.default_category = default_category
+        self.names = []
+        self.entry_categories = []
+        self.entry_aliases = []
+        self.keys = []
+        self.phrases = {}
+        self.prefixes = set()
+        self.max_tokens = 0
+        self.categories = []
+        self.category_ids = {}
+        self.canonical_cache = {}
+        self.signature = None
+        
+        for entry in entries:
+            self.add_entry(entry)
+
+    def __getstate__(self):
+        return {
+            'default_category': self.default_category,
+            'entries': self.entries()
+        }
+
+    def __setstate__(self, state):
+        self.__init__(state['entries'], state['default_category'])
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, term):
+        return self.canonical_id(term) is not None
+
+    @classmethod
+    def load(cls, file_path, file_format=None, default_category='other'):
+        return cls(cls.read_records(file_path, file_format), default_category)
+
+    @staticmethod
+    def read_records(file_path, file_format=None):
+        file_format = file_format or os.path.splitext(file_path)[1].lstrip('.').lower()
+        
+        with open(file_path, 'r', encoding='utf-8', newline='') as file:
+            if file_format == 'csv':
+                yield from csv.DictReader(file)
+            elif file_format == 'jsonl':
+                for line in file:
+                    if line.strip():
+                        yield json.loads(line)
+            elif file_format == 'json':
+                data = json.load(file)
+                yield from (data['skills'] if isinstance(data, dict) else data)
+            elif file_format == 'txt':
+                for line in file:
+                    terms = [term.strip() for term in line.split(',')]
+                    if terms[0]:
+                        yield {'name': terms[0], 'aliases': [term for term in terms[1:] if term]}
+            else:
+                raise TaxonomyError(f"Unsupported taxonomy file format: {file_format}")
+
+    def add_entry(self, entry):
+        if isinstance(entry, str):
+            return self.add(entry)
+        
+        aliases = entry.get('aliases') or []
+        if isinstance(aliases, str):
+            aliases = [alias.strip() for alias in re.split(r'[|;]', aliases) if alias.strip()]
+        return self.add(entry['name'], entry.get('category') or None, aliases)
+
+    def add(self, name, category=None, aliases=()):
+        name = name.strip().lower()
+        if not name:
+            raise TaxonomyError("Taxonomy entries need a name")
+        
+        category = (category or self.default_category).strip().lower()
+        if category not in self.category_ids:
+            self.category_ids[category] = len(self.categories)
+            self.categories.append(('skills', category))
+        
+        key = self.normalize(name)
+        if not key:
+            raise TaxonomyError(f"Taxonomy entry has no matchable tokens: {name}")
+        
+        skill_id = self.phrases.get(key)
+        if skill_id is None:
+            skill_id = len(self.names)
+            self.names.append(name)
+            self.entry_categories.append(category)
+            self.entry_aliases.append([])
+            self.keys.append(key)
+            self.add_phrase(key, skill_id)
+        
+        for alias in aliases:
+            alias = alias.strip().lower()
+            alias_key = self.normalize(alias)
+            if alias_key and alias_key not in self.phrases:
+                self.entry_aliases[skill_id].append(alias)
+                self.add_phrase(alias_key, skill_id)
+        
+        self.canonical_cache = {}
+        self.signature = None
+        return skill_id
+
+    def add_phrase(self, key, skill_id):
+        self.phrases[key] = skill_id
+        tokens = key.split(' ')
+        self.max_tokens = max(self.max_tokens, len(tokens))
+        for length in range(1, len(tokens)):
+            self.prefixes.add(' '.join(tokens[:length]))
+
+    def normalize_token(self, token):
+        if token[0] == '.':
+            return '.' + token[1:].translate(self.separators)
+        return token.translate(self.separators)
+
+    def normalize(self, term):
+        tokens = (self.normalize_token(match.group()) for match in self.token_regex.finditer(term.lower()))
+        return ' '.join(token for token in tokens if token)
+
+    def entries(self):
+        return [
+            {'name': name, 'category': category, 'aliases': list(aliases)}
+            for name, category, aliases in zip(self.names, self.entry_categories, self.entry_aliases)
+        ]
+
+    @property
+    def version(self):
+        if self.signature is None:
+            digest = hashlib.sha256()
+            for entry in self.entries():
+                digest.update(json.dumps(entry, sort_keys=True).encode('utf-8'))
+            self.signature = digest.hexdigest()[:16]
+        return self.signature
+
+    @property
+    def terms(self):
+        return {name: {('skills', category): 0} for name, category in zip(self.names, self.entry_categories)}
+
+    def canonical_id(self, term):
+        return self.phrases.get(self.normalize(term))
+
+    def canonical(self, term):
+        name = self.canonical_cache.get(term)
+        if name is None:
+            skill_id = self.canonical_id(term)
+            name = term.strip().lower() if skill_id is None else self.names[skill_id]
+            self.canonical_cache[term] = name
+        return name
+
+    def category(self, term):
+        skill_id = self.canonical_id(term)
+        return None if skill_id is None else self.entry_categories[skill_id]
+
+    def new_state(self, unique=False):
+        found = {key: set() if unique else [] for key in self.categories}
+        collect = {}
+        for key, values in found.items():
+            collect[key] = values.add if unique else values.append
+        
+        return {
+            'found': found,
+            'collect': collect,
+            'last_end': {}
+        }
+
+    def scan_range(self, text_lower, start, stop, state, offset=0):
+        collect = state['collect']
+        last_end = state['last_end']
+        phrases = self.phrases
+        prefixes = self.prefixes
+        
+        tokens = []
+        lookahead = None
+        for match in self.token_regex.finditer(text_lower, max(start, last_end.get('taxonomy', 0) - offset)):
+            if match.start() >= stop:
+                lookahead = 0 if lookahead is None else lookahead + 1
+                if lookahead >= self.max_tokens:
+                    break
+            tokens.append((match.start(), match.end(), self.normalize_token(match.group())))
+        
+        i = 0
+        while i < len(tokens) and tokens[i][0] < stop:
+            key = tokens[i][2]
+            best = None
+            j = i
+            while True:
+                skill_id = phrases.get(key)
+                if skill_id is not None:
+                    best = (j, skill_id)
+                if key not in prefixes or j + 1 >= len(tokens):
+                    break
+                if text_lower[tokens[j][1]:tokens[j + 1][0]].strip(self.phrase_gap):
+                    break
+                j += 1
+                key += ' ' + tokens[j][2]
+            
+            if best is None:
+                i += 1
+                continue
+            
+            j, skill_id = best
+            collect[('skills', self.entry_categories[skill_id])](self.names[skill_id])
+            i = j + 1
+        
+        if i:
+            last_end['taxonomy'] = tokens[i - 1][1] + offset
+
+    def scan(self, text_lower):
+        state = self.new_state()
+        self.scan_range(text_lower, 0, len(text_lower), state)
+        return state['found']
+
+    def extract(self, text):
+        found = self.scan(text.lower())
+        return {category: sorted(set(found[('skills', category)])) for _, category in self.categories}
\ No newline at end of file
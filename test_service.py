@@ -0,0 +1,50 @@
+import asyncio
+import unittest
+
+from resume_parser import ResumeParser
+from service import MatchingService, ServiceClient
+
+RESUME_TEXT = "Python developer with 3 years of experience in SQL and Docker. Bachelor of Computer Science"
+
+class MatchValidationTest(unittest.TestCase):
+    def setUp(self):
+        self.service = MatchingService(parse_workers=0)
+        self.client = ServiceClient(self.service)
+        self.resume = ResumeParser().parse_text(RESUME_TEXT, 'resume.txt')
+
+    def tearDown(self):
+        self.service.close()
+
+    def post_matches(self, *resumes):
+        async def run():
+            return await asyncio.gather(*[
+                self.client.post('/match', {'resume': resume, 'top_k': 3}) for resume in resumes
+            ])
+        return asyncio.run(run())
+
+    def test_non_numeric_years_is_rejected(self):
+        bad = dict(self.resume, experience={'years': 'x', 'positions': []})
+        
+        (status, body), = self.post_matches(bad)
+        
+        self.assertEqual(status, 400)
+        self.assertIn('resume.experience.years', body['error'])
+
+    def test_non_list_education_category_is_rejected(self):
+        bad = dict(self.resume, education={'degree': 5, 'field': []})
+        
+        (status, body), = self.post_matches(bad)
+        
+        self.assertEqual(status, 400)
+        self.assertIn('resume.education.degree', body['error'])
+
+    def test_bad_resume_does_not_fail_batched_requests(self):
+        bad = dict(self.resume, skills={'programming': [1, 2]})
+        
+        results = self.post_matches(self.resume, bad, self.resume, self.resume)
+        
+        self.assertEqual([status for status, _ in results], [200, 400, 200, 200])
+        self.assertEqual(len(results[0][1]['matches']), 3)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file